@@ -0,0 +1,95 @@
+"""Micro-benchmark of getting the plot style in :meth:`resilientplotterclass.rpclass._get_kwargs`.
+
+``_get_kwargs`` used to find the plot style with ``inspect.stack()[1].function``. The plot methods now pass the plot style explicitly. This script
+times, at several call-stack depths, the removed ``inspect.stack()`` lookup and a full ``_get_kwargs`` call with an explicit plot style.
+
+Run with ``python benchmarks/bench_get_kwargs.py``.
+"""
+
+# Packages
+import functools
+import inspect
+import timeit
+
+import resilientplotterclass as rpc
+
+# Define call-stack depths and number of calls per timing
+DEPTHS = [0, 10, 30]
+NUMBER = 2000
+
+
+# Call a function at a given call-stack depth
+def _call_at_depth(depth, func):
+    """Call a function at a given call-stack depth.
+
+    :param depth: Number of extra frames on the call stack.
+    :type depth:  int
+    :param func:  Function to call.
+    :type func:   callable
+    :return:      Return value of the function.
+    :rtype:       object
+    """
+
+    # Add a frame to the call stack or call the function
+    if depth > 0:
+        return _call_at_depth(depth - 1, func)
+    return func()
+
+
+# Get the plot style from the call stack (removed implementation)
+def _get_plot_style():
+    """Get the plot style from the name of the calling function, as ``_get_kwargs`` did before the plot style was passed explicitly.
+
+    :return: Plot style.
+    :rtype:  str
+    """
+
+    # Get plot type (name of the function calling this method)
+    return inspect.stack()[1].function
+
+
+# Call the removed implementation from a plot method
+def pcolormesh():
+    """Get the plot style of this plot method from the call stack.
+
+    :return: Plot style.
+    :rtype:  str
+    """
+
+    # Get the plot style
+    return _get_plot_style()
+
+
+# Time a function at a given call-stack depth
+def _time(depth, func):
+    """Time a function at a given call-stack depth.
+
+    :param depth: Number of extra frames on the call stack.
+    :type depth:  int
+    :param func:  Function to time.
+    :type func:   callable
+    :return:      Mean time per call in microseconds.
+    :rtype:       float
+    """
+
+    # Get the best mean time per call of five repeats
+    return min(timeit.repeat(lambda: _call_at_depth(depth, func), number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+# Run the benchmark
+def main():
+    """Run the benchmark and print the mean time per call."""
+
+    # Get the keyword arguments once, so the timings exclude combining the guidelines
+    rpclass = rpc.rpclass()
+    get_kwargs = functools.partial(rpclass._get_kwargs, "pcolormesh", data_style="bathymetry")
+    get_kwargs()
+
+    # Print the mean time per call
+    print("{:>16} {:>22} {:>22}".format("call stack depth", "inspect.stack() [us]", "_get_kwargs() [us]"))
+    for depth in DEPTHS:
+        print("{:>16} {:>22.1f} {:>22.1f}".format(depth, _time(depth, pcolormesh), _time(depth, get_kwargs)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,65 @@
+import importlib
 import importlib.metadata
+import threading
 
-from . import axes, basemaps, colormaps, geometries, interactive, rescale, structured_data, unstructured_data, utils, videos
 from .rpclass import rpclass
 
 __version__ = importlib.metadata.version(__package__)
 
-__all__ = ["axes", "basemaps", "colormaps", "structured_data", "unstructured_data", "geometries", "interactive", "rescale", "utils", "videos"]
+_RPC_LOCK = threading.Lock()
 
-rpc = rpclass()
+__all__ = [
+    "axes",
+    "basemaps",
+    "colormaps",
+    "structured_data",
+    "unstructured_data",
+    "geometries",
+    "interactive",
+    "rescale",
+    "streamlines",
+    "utils",
+    "videos",
+]
+
+
+# Lazily import submodules and create the default resilient plotter class
+def __getattr__(name):
+    """Import submodules and create the default resilient plotter class on first attribute access.
+
+    Submodules such as :mod:`resilientplotterclass.interactive` (folium, ipyleaflet), :mod:`resilientplotterclass.basemaps` (contextily) and
+    :mod:`resilientplotterclass.videos` (opencv) depend on heavy packages. They are only imported when they are used for the first time.
+    The default resilient plotter class ``rpc`` reads the default guidelines and registers colormaps, so it is only created when it is used
+    for the first time (e.g. ``from resilientplotterclass import rpc``).
+
+    :param name: Attribute name.
+    :type name:  str
+    :return:     Submodule or default resilient plotter class.
+    :rtype:      module or resilientplotterclass.rpclass.rpclass
+    """
+
+    # Create default resilient plotter class
+    if name == "rpc":
+        with _RPC_LOCK:
+            if "rpc" not in globals():
+                globals()["rpc"] = rpclass()
+        return globals()["rpc"]
+
+    # Import submodule
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+
+    # Raise error for unknown attributes
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+# List attributes including submodules that are not imported yet
+def __dir__():
+    """List attributes including submodules that are not imported yet.
+
+    :return: Attribute names.
+    :rtype:  list[str]
+    """
+
+    # Return attribute names
+    return sorted(set(globals()) | set(__all__) | {"rpc"})
@@ -1,7 +1,46 @@
+import numpy as np
+from matplotlib.ticker import AutoLocator, ScalarFormatter
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 import resilientplotterclass as rpc
 
+# Define rescale modes (rescale the x and y coordinates of the data or the tick labels of the axis)
+RESCALE_MODES = ["data", "axis"]
+
+
+class _ScaledLocator(AutoLocator):
+    """Tick locator that places ticks at nice values of the rescaled x and y coordinates.
+
+    :param scale_factor: Scale factor from data coordinates to tick label values.
+    :type scale_factor:  float
+    """
+
+    def __init__(self, scale_factor):
+        super().__init__()
+        self.scale_factor = scale_factor
+
+    def tick_values(self, vmin, vmax):
+        return super().tick_values(vmin * self.scale_factor, vmax * self.scale_factor) / self.scale_factor
+
+
+class _ScaledFormatter(ScalarFormatter):
+    """Tick label formatter that labels ticks with the rescaled x and y coordinates.
+
+    :param scale_factor: Scale factor from data coordinates to tick label values.
+    :type scale_factor:  float
+    """
+
+    def __init__(self, scale_factor):
+        super().__init__(useOffset=False)
+        self.set_scientific(False)
+        self.scale_factor = scale_factor
+
+    def __call__(self, x, pos=None):
+        return super().__call__(x * self.scale_factor, pos)
+
+    def set_locs(self, locs):
+        super().set_locs(np.asarray(locs) * self.scale_factor)
+
 
 def append_cbar_axis(ax, append_axes_kwargs=None):
     """Append a colorbar axis.
@@ -36,6 +75,7 @@ def format(
     data=None,
     crs=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -54,9 +94,12 @@ def format(
     :type crs:            pyproj.CRS or rasterio.CRS or str, optional
     :param xy_unit:       Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:        str, optional
-    :param xlim:          x limits.
+    :param rescale_mode:  Rescale mode, see :data:`RESCALE_MODES`. If ``"data"``, the data is rescaled by the plot functions and the limits
+                          are rescaled. If ``"axis"``, the data and limits are in data coordinates and the tick labels are rescaled.
+    :type rescale_mode:   str, optional
+    :param xlim:          x limits in data coordinates.
     :type xlim:           list[float], optional
-    :param ylim:          y limits.
+    :param ylim:          y limits in data coordinates.
     :type ylim:           list[float], optional
     :param xlabel_kwargs: Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:  dict, optional
@@ -78,25 +121,24 @@ def format(
                `matplotlib.axis.grid <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.grid.html>`_.
     """
 
-    # Create keyword arguments if not provided
-    if xlabel_kwargs is None:
-        xlabel_kwargs = {}
-    if ylabel_kwargs is None:
-        ylabel_kwargs = {}
-    if title_kwargs is None:
-        title_kwargs = {}
-    if aspect_kwargs is None:
-        aspect_kwargs = {}
-    if grid_kwargs is None:
-        grid_kwargs = {}
+    # Create or copy keyword arguments (guideline keyword arguments are immutable)
+    xlabel_kwargs = {} if xlabel_kwargs is None else dict(xlabel_kwargs)
+    ylabel_kwargs = {} if ylabel_kwargs is None else dict(ylabel_kwargs)
+    title_kwargs = {} if title_kwargs is None else dict(title_kwargs)
+    aspect_kwargs = {} if aspect_kwargs is None else dict(aspect_kwargs)
+    grid_kwargs = {} if grid_kwargs is None else dict(grid_kwargs)
+
+    # Check if rescale mode is supported
+    if rescale_mode not in RESCALE_MODES:
+        raise ValueError("rescale_mode '{}' not supported. Available: {}".format(rescale_mode, RESCALE_MODES))
 
     # Get the rescale parameters
     scale_factor, xlabel, ylabel = rpc.rescale.get_rescale_parameters(data=data, crs=crs, xy_unit=xy_unit)
 
     # Rescale x and y limits
-    if xlim is not None:
+    if rescale_mode == "data" and xlim is not None:
         xlim = [x * scale_factor for x in xlim]
-    if ylim is not None:
+    if rescale_mode == "data" and ylim is not None:
         ylim = [y * scale_factor for y in ylim]
 
     # Set default keyword arguments
@@ -121,6 +163,12 @@ def format(
     # Set grid
     ax.grid(**grid_kwargs)
 
+    # Set tick locators and formatters of the rescaled x and y coordinates
+    if rescale_mode == "axis" and scale_factor != 1:
+        for axis in [ax.xaxis, ax.yaxis]:
+            axis.set_major_locator(_ScaledLocator(scale_factor))
+            axis.set_major_formatter(_ScaledFormatter(scale_factor))
+
     # Set tick label format
     ax.ticklabel_format(useOffset=False, style="plain")
 
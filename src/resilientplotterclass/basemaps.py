@@ -8,6 +8,7 @@ def plot_basemap(
     crs=None,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -25,6 +26,8 @@ def plot_basemap(
     :type ax:             matplotlib.axes.Axes, optional
     :param xy_unit:       Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:        str, optional
+    :param rescale_mode:  Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:   str, optional
     :param xlim:          x limits.
     :type xlim:           list[float], optional
     :param ylim:          y limits.
@@ -64,6 +67,7 @@ def plot_basemap(
         ax,
         crs=crs,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -73,8 +77,8 @@ def plot_basemap(
         grid_kwargs=grid_kwargs,
     )
 
-    # Add basemap
-    _add_basemap(ax=ax, scale=scale_factor, crs=crs, **kwargs)
+    # Add basemap (in axis rescale mode, the tick labels are rescaled instead of the basemap)
+    _add_basemap(ax=ax, scale=scale_factor if rescale_mode == "data" else 1, crs=crs, **kwargs)
 
     # Return axis
     return ax
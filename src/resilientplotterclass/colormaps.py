@@ -1,43 +1,124 @@
+import functools
 import glob
+import importlib
 import os
+import threading
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 
 
-# Get colormaps
-def _get_colormaps():
-    """Get colormaps.
+# Define custom colormaps based on matplotlib colormaps
+MPL_COLORMAPS = {"bathymetry": "Spectral_r", "bedforms": "RdBu_r", "morphology": "RdBu_r", "diverging": "RdBu_r"}
 
-    :return: Colormaps.
-    :rtype:  list[matplotlib.colors.LinearSegmentedColormap]
+# Define the colour scale of contour colormaps
+CONTOUR_RGBA_SCALES = (0.75, 0.75, 0.75, 1)
+
+# Define packages that register colormaps with a name prefix
+PACKAGE_COLORMAP_PREFIXES = {"cmo.": "cmocean.cm", "cet_": "colorcet"}
+
+# Lock to register colormaps from one thread at a time
+_REGISTER_LOCK = threading.Lock()
+
+
+# Get file paths of colormaps
+@functools.cache
+def _get_file_paths_colormaps():
+    """Get file paths of custom colormaps defined in text files.
+
+    :return: File paths of colormaps, keyed by colormap name.
+    :rtype:  dict[str, str]
+    """
+
+    # Get file paths of colormaps
+    file_paths = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "cmaps", "*.txt")))
+
+    # Return file paths of colormaps
+    return {os.path.basename(file_path).split(".")[0]: file_path for file_path in file_paths}
+
+
+# Get colormap names
+def _get_colormap_names():
+    """Get names of custom colormaps without building them.
+
+    :return: Colormap names.
+    :rtype:  list[str]
+    """
+
+    # Return colormap names
+    return list(MPL_COLORMAPS.keys()) + list(_get_file_paths_colormaps().keys())
+
+
+# Get colors from a file
+def _get_colors_from_file(file_path):
+    """Get colors from a colormap text file with RGBA values between 0 and 255.
+
+    The colors are cached as a binary array of RGBA values between 0 and 1 in the matplotlib cache directory. The cache file is keyed by the
+    modification time and size of the text file, so it is rebuilt when the text file changes, and it is loaded memory-mapped on subsequent
+    calls. If the cache directory is not writable, the text file is parsed on every call.
+
+    :param file_path: File path to the colormap text file.
+    :type file_path:  str
+    :return:          Colors.
+    :rtype:           numpy.ndarray
+
+    See also: `numpy.load <https://numpy.org/doc/stable/reference/generated/numpy.load.html>`_.
+    """
+
+    # Get file path to the cache file
+    cmap_name = os.path.basename(file_path).split(".")[0]
+    file_stat = os.stat(file_path)
+    dir_path_cache = os.path.join(mpl.get_cachedir(), "resilientplotterclass", "cmaps")
+    file_path_cache = os.path.join(dir_path_cache, "{}-{}-{}.npy".format(cmap_name, file_stat.st_mtime_ns, file_stat.st_size))
+
+    # Load colors from the cache file
+    if os.path.exists(file_path_cache):
+        try:
+            return np.load(file_path_cache, mmap_mode="r")
+        except (OSError, ValueError):
+            pass
+
+    # Get colors from the text file
+    colors = np.loadtxt(file_path, dtype=np.float32, ndmin=2) / np.float32(255)
+
+    # Write colors to the cache file, replacing outdated cache files
+    try:
+        os.makedirs(dir_path_cache, exist_ok=True)
+        for file_path_outdated in glob.glob(os.path.join(dir_path_cache, "{}-*.npy".format(cmap_name))):
+            os.remove(file_path_outdated)
+        file_path_tmp = "{}.{}.tmp".format(file_path_cache, os.getpid())
+        with open(file_path_tmp, "wb") as file:
+            np.save(file, colors)
+        os.replace(file_path_tmp, file_path_cache)
+    except OSError:
+        pass
+
+    # Return colors
+    return colors
+
+
+# Get colormap
+@functools.cache
+def _get_colormap(cmap_name):
+    """Get a custom colormap and its contour colormap. Colormaps are built once and memoized.
+
+    :param cmap_name: Name of the custom colormap.
+    :type cmap_name:  str
+    :return:          Colormap and contour colormap.
+    :rtype:           tuple[matplotlib.colors.LinearSegmentedColormap, matplotlib.colors.LinearSegmentedColormap]
 
     See also: `matplotlib.colors.LinearSegmentedColormap <https://matplotlib.org/stable/api/_as_gen/matplotlib.colors.LinearSegmentedColormap.html>`_.
     """
 
     # Function to scale colors
     def scale_colors(colors, rgba_scales=(1, 1, 1, 1)):
-        if isinstance(rgba_scales, (int, float)):
-            rgba_scales = (rgba_scales, rgba_scales, rgba_scales, rgba_scales)
-        colors_new = []
-        for r, g, b, a in colors:
-            colors_new.append((r * rgba_scales[0], g * rgba_scales[1], b * rgba_scales[2], a * rgba_scales[3]))
-        return colors_new
+        return np.asarray(colors) * np.asarray(rgba_scales)
 
     # Function to get colors from a colormap
     def get_colors_from_cmap(cmap_name):
         cmap = plt.get_cmap(cmap_name)
-        colors = [cmap(i) for i in range(cmap.N)]
-        return colors
-
-    # Function to get colors from a file
-    def get_colors_from_file(file_path):
-        colors = []
-        with open(file_path, "r") as file:
-            for line in file:
-                colors.append(tuple(float(color) for color in line.split()))
-        colors = scale_colors(colors, rgba_scales=1 / 255)
+        colors = cmap(np.arange(cmap.N))
         return colors
 
     # Function to get a colormap from colors
@@ -45,37 +126,101 @@ def _get_colormaps():
         cmap = plt.cm.colors.LinearSegmentedColormap.from_list(cmap_name, colors)
         return cmap
 
-    # Initialise colormaps
-    cmaps = []
-    cmaps_contours = []
-
-    # Add colormaps from matplotlib colormaps
-    cmaps.append(get_cmap_from_colors(get_colors_from_cmap("Spectral_r"), "bathymetry"))
-    cmaps_contours.append(
-        get_cmap_from_colors(scale_colors(get_colors_from_cmap("Spectral_r"), rgba_scales=(0.75, 0.75, 0.75, 1)), "bathymetry_contour")
-    )
-    cmaps.append(get_cmap_from_colors(get_colors_from_cmap("RdBu_r"), "bedforms"))
-    cmaps_contours.append(get_cmap_from_colors(scale_colors(get_colors_from_cmap("RdBu_r"), rgba_scales=(0.75, 0.75, 0.75, 1)), "bedforms_contour"))
-    cmaps.append(get_cmap_from_colors(get_colors_from_cmap("RdBu_r"), "morphology"))
-    cmaps_contours.append(get_cmap_from_colors(scale_colors(get_colors_from_cmap("RdBu_r"), rgba_scales=(0.75, 0.75, 0.75, 1)), "morphology_contour"))
-    cmaps.append(get_cmap_from_colors(get_colors_from_cmap("RdBu_r"), "diverging"))
-    cmaps_contours.append(get_cmap_from_colors(scale_colors(get_colors_from_cmap("RdBu_r"), rgba_scales=(0.75, 0.75, 0.75, 1)), "diverging_contour"))
-
-    # Add colormaps from text files
-    file_path_cmaps = glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "cmaps", "*.txt"))
-    for file_path in file_path_cmaps:
-        cmap_name = os.path.basename(file_path).split(".")[0]
-        colors = get_colors_from_file(file_path)
-        cmaps.append(get_cmap_from_colors(colors, cmap_name))
-        cmaps_contours.append(get_cmap_from_colors(scale_colors(colors, rgba_scales=(0.75, 0.75, 0.75, 1)), cmap_name + "_contour"))
+    # Get colors from matplotlib colormaps or text files
+    if cmap_name in MPL_COLORMAPS.keys():
+        colors = get_colors_from_cmap(MPL_COLORMAPS[cmap_name])
+    elif cmap_name in _get_file_paths_colormaps().keys():
+        colors = _get_colors_from_file(_get_file_paths_colormaps()[cmap_name])
+    else:
+        raise ValueError("Colormap '{}' not in custom colormaps. Available: {}".format(cmap_name, _get_colormap_names()))
+
+    # Get colormap and contour colormap
+    cmap = get_cmap_from_colors(colors, cmap_name)
+    cmap_contour = get_cmap_from_colors(scale_colors(colors, rgba_scales=CONTOUR_RGBA_SCALES), cmap_name + "_contour")
+
+    # Return colormap and contour colormap
+    return cmap, cmap_contour
+
+
+# Get colormaps
+def _get_colormaps():
+    """Get colormaps.
+
+    :return: Colormaps.
+    :rtype:  list[matplotlib.colors.LinearSegmentedColormap]
+
+    See also: `matplotlib.colors.LinearSegmentedColormap <https://matplotlib.org/stable/api/_as_gen/matplotlib.colors.LinearSegmentedColormap.html>`_.
+    """
+
+    # Get colormaps and contour colormaps
+    cmaps, cmaps_contours = zip(*[_get_colormap(cmap_name) for cmap_name in _get_colormap_names()])
 
     # Combine colormaps
-    cmaps = cmaps + cmaps_contours
+    cmaps = list(cmaps) + list(cmaps_contours)
 
     # Return colormaps
     return cmaps
 
 
+# Register colormap
+@functools.cache
+def _register_colormap(cmap_name):
+    """Register a custom colormap or a colormap of cmocean or colorcet.
+
+    :param cmap_name: Name of the colormap.
+    :type cmap_name:  str
+    :return:          True if the colormap is a custom colormap or a colormap of cmocean or colorcet.
+    :rtype:           bool
+    """
+
+    # Register colormaps of cmocean and colorcet
+    for prefix, package in PACKAGE_COLORMAP_PREFIXES.items():
+        if cmap_name.startswith(prefix):
+            importlib.import_module(package)
+            return True
+
+    # Get name of the custom colormap
+    base_name = cmap_name.removesuffix("_r").removesuffix("_contour")
+    if base_name not in _get_colormap_names():
+        return False
+
+    # Register colormaps (functools.cache does not prevent concurrent first calls, so check and register under a lock)
+    with _REGISTER_LOCK:
+        for cmap in _get_colormap(base_name):
+            if cmap.name not in mpl.colormaps:
+                mpl.colormaps.register(cmap=cmap)
+                mpl.colormaps.register(cmap=cmap.reversed())
+
+    # Return True for custom colormaps
+    return True
+
+
+# Register colormap
+def register_colormap(cmap_name):
+    """Register a custom colormap on first use.
+
+    Registers the colormap, its contour colormap and their reversed colormaps for names like ``'bathymetry'``, ``'bathymetry_r'``,
+    ``'bathymetry_contour'`` or ``'bathymetry_contour_r'``. Colormaps of cmocean (``'cmo.*'``) and colorcet (``'cet_*'``) are registered by
+    importing the package. The plotting functions register the colormap passed as ``cmap``, so the names can be used directly with them. To use
+    the names with matplotlib directly, register the colormaps first (see :func:`register_colormaps`). Registration is memoized and thread-safe,
+    so repeated calls are cheap.
+
+    :param cmap_name: Name of the colormap. Colormap objects and ``None`` are ignored.
+    :type cmap_name:  str or matplotlib.colors.Colormap or None
+    :return:          True if the colormap is a custom colormap or a colormap of cmocean or colorcet.
+    :rtype:           bool
+
+    See also: `Creating Colormaps in Matplotlib <https://matplotlib.org/stable/users/explain/colors/colormap-manipulation.html>`_.
+    """
+
+    # Ignore colormap objects and None
+    if not isinstance(cmap_name, str):
+        return False
+
+    # Register colormap
+    return _register_colormap(cmap_name)
+
+
 # Register colormaps
 def register_colormaps():
     """Register colormaps.
@@ -86,14 +231,9 @@ def register_colormaps():
     See also: `Creating Colormaps in Matplotlib <https://matplotlib.org/stable/users/explain/colors/colormap-manipulation.html>`_.
     """
 
-    # Get colormaps
-    cmaps = _get_colormaps()
-
     # Register colormaps
-    for cmap in cmaps:
-        if cmap.name not in plt.colormaps():
-            mpl.colormaps.register(cmap=cmap)
-            mpl.colormaps.register(cmap=cmap.reversed())
+    for cmap_name in _get_colormap_names():
+        register_colormap(cmap_name)
 
 
 # Plot colormaps
@@ -1,4 +1,3 @@
-import cartopy.feature as cfeature
 import geopandas as gpd
 import matplotlib.pyplot as plt
 import numpy as np
@@ -94,6 +93,8 @@ def get_gdf_cartopy(features=None, bounds=None, crs=None, buffer=0.1):
     See also: `cartopy.feature <https://scitools.org.uk/cartopy/docs/latest/matplotlib/feature_interface.html>`_.
     """
 
+    import cartopy.feature as cfeature
+
     # Define cartopy features and their styles
     CFEATURES = {
         "borders": cfeature.BORDERS,
@@ -301,6 +302,7 @@ def plot_geometries(
     gdf,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -319,6 +321,8 @@ def plot_geometries(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param xlim:               x limits.
     :type xlim:                list[float], optional
     :param ylim:               y limits.
@@ -349,6 +353,9 @@ def plot_geometries(
                `geopandas.GeoDataFrame.plot <https://geopandas.org/en/stable/docs/reference/api/geopandas.GeoDataFrame.plot.html>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
@@ -356,8 +363,9 @@ def plot_geometries(
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=gdf, xy_unit=xy_unit)
 
-    # Rescale the GeoDataFrame
-    gdf = rpc.rescale.rescale(data=gdf, scale_factor=scale_factor)
+    # Rescale the GeoDataFrame (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        gdf = rpc.rescale.rescale(data=gdf, scale_factor=scale_factor)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and "cax" not in kwargs and "legend" in kwargs and kwargs["legend"]:
@@ -371,6 +379,7 @@ def plot_geometries(
         data=gdf,
         ax=ax,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -9,6 +9,8 @@ import xyzservices
 from folium.plugins import Draw
 from matplotlib.colors import to_hex
 
+import resilientplotterclass as rpc
+
 
 def _explore_image(da, m, cmap="Spectral_r", vmin=None, vmax=None, legend=None, legend_kwds={}, **kwargs):
     """ "Plot data interactively using folium.
@@ -40,6 +42,9 @@ def _explore_image(da, m, cmap="Spectral_r", vmin=None, vmax=None, legend=None,
     if not np.issubdtype(da.dtype, np.number):
         da = da.astype(float)
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(cmap)
+
     # Get cmap
     cmap = plt.get_cmap(cmap)
 
@@ -278,6 +283,12 @@ def plot_geometries(gdf, m=None, **kwargs):
     # Set map bounds
     m = _set_map_bounds(m, gdf.total_bounds)
 
+    # Copy nested keyword arguments (geopandas.explore modifies them and guideline keyword arguments are immutable)
+    kwargs = {key: dict(value) if isinstance(value, dict) else value for key, value in kwargs.items()}
+
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Plot GeoDataFrame
     gdf.explore(m=m, **kwargs)
 
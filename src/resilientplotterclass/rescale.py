@@ -1,5 +1,9 @@
+import functools
+import weakref
+
 import geopandas as gpd
 import numpy as np
+import shapely
 import xarray as xr
 import xugrid as xu
 from pyproj import CRS as pyprojCRS
@@ -154,6 +158,83 @@ def _rescale_xarray(da, scale_factor):
     return da
 
 
+# Rescaled grids per original grid, dropped when the original grid is garbage collected
+_RESCALED_GRIDS = weakref.WeakKeyDictionary()
+
+
+def _rescale_grid(grid, scale_factor):
+    """Rescale the x and y dimensions of a grid.
+
+    :param grid:         Grid to rescale.
+    :type grid:          xugrid.Ugrid1d or xugrid.Ugrid2d
+    :param scale_factor: Scale factor to rescale the x and y dimensions to.
+    :type scale_factor:  float
+    :return:             Rescaled grid.
+    :rtype:              xugrid.Ugrid1d or xugrid.Ugrid2d
+    """
+
+    # Rescale the x and y dimensions of 1D grid
+    if isinstance(grid, xu.Ugrid1d):
+        grid_rescaled = xu.Ugrid1d(
+            node_x=grid.node_x * scale_factor,
+            node_y=grid.node_y * scale_factor,
+            fill_value=grid.fill_value,
+            edge_node_connectivity=grid.edge_node_connectivity,
+        )
+
+    # Rescale x and y dimensions of 2D grid
+    elif isinstance(grid, xu.Ugrid2d):
+        grid_rescaled = xu.Ugrid2d(
+            node_x=grid.node_x * scale_factor,
+            node_y=grid.node_y * scale_factor,
+            fill_value=grid.fill_value,
+            face_node_connectivity=grid.face_node_connectivity,
+            edge_node_connectivity=grid.edge_node_connectivity,
+        )
+
+    # Assign the coordinate reference system to the grid
+    if grid.crs is not None:
+        grid_rescaled.set_crs(grid.crs)
+
+    # Return rescaled grid
+    return grid_rescaled
+
+
+def _get_rescaled_grid(grid, scale_factor):
+    """Get a rescaled grid from the cache or rescale the grid.
+
+    Rescaled grids are cached per original grid object and scale factor, so that plotting many timesteps of the same grid reuses the
+    rescaled grid together with its derived topology (e.g. edge connectivity and spatial indices). The node coordinates and coordinate
+    reference system of the original grid are checked before a cached grid is reused.
+
+    :param grid:         Grid to rescale.
+    :type grid:          xugrid.Ugrid1d or xugrid.Ugrid2d
+    :param scale_factor: Scale factor to rescale the x and y dimensions to.
+    :type scale_factor:  float
+    :return:             Rescaled grid.
+    :rtype:              xugrid.Ugrid1d or xugrid.Ugrid2d
+    """
+
+    # Get the rescaled grids of the original grid
+    try:
+        rescaled_grids = _RESCALED_GRIDS.setdefault(grid, {})
+    except TypeError:
+        return _rescale_grid(grid, scale_factor)
+
+    # Get the rescaled grid from the cache if the original grid is unchanged
+    fingerprint = (grid.node_x, grid.node_y, grid.crs)
+    cached = rescaled_grids.get(scale_factor)
+    if cached is not None and all(a is b for a, b in zip(cached[0], fingerprint)):
+        return cached[1]
+
+    # Rescale the grid and add it to the cache
+    grid_rescaled = _rescale_grid(grid, scale_factor)
+    rescaled_grids[scale_factor] = (fingerprint, grid_rescaled)
+
+    # Return rescaled grid
+    return grid_rescaled
+
+
 def _rescale_xugrid(uda, scale_factor):
     """Rescale the x and y dimensions of a UgridDataArray or UgridDataset.
 
@@ -237,30 +318,6 @@ def _rescale_xugrid(uda, scale_factor):
         # Return the rescaled data
         return da
 
-    # Function to rescale the grid
-    def _rescale_grid(grid, scale_factor):
-        # Rescale the x and y dimensions of 1D grid
-        if isinstance(grid, xu.Ugrid1d):
-            grid = xu.Ugrid1d(
-                node_x=grid.node_x * scale_factor,
-                node_y=grid.node_y * scale_factor,
-                fill_value=grid.fill_value,
-                edge_node_connectivity=grid.edge_node_connectivity,
-            )
-
-        # Rescale x and y dimensions of 2D grid
-        elif isinstance(grid, xu.Ugrid2d):
-            grid = xu.Ugrid2d(
-                node_x=grid.node_x * scale_factor,
-                node_y=grid.node_y * scale_factor,
-                fill_value=grid.fill_value,
-                face_node_connectivity=grid.face_node_connectivity,
-                edge_node_connectivity=grid.edge_node_connectivity,
-            )
-
-        # Return rescaled grid
-        return grid
-
     # Rename the dimensions of the data
     da = _rename_dims(uda)
 
@@ -269,15 +326,12 @@ def _rescale_xugrid(uda, scale_factor):
 
     # Assign the coordinate arrays to the data
     if isinstance(uda, xu.UgridDataArray):
-        grid = _rescale_grid(uda.grid, scale_factor)
+        grid = _get_rescaled_grid(uda.grid, scale_factor)
         uda_rescaled = xu.UgridDataArray(obj=xr.DataArray(da), grid=grid)
     elif isinstance(uda, xu.UgridDataset):
-        grids = [_rescale_grid(grid, scale_factor) for grid in uda.grids]
+        grids = [_get_rescaled_grid(grid, scale_factor) for grid in uda.grids]
         uda_rescaled = xu.UgridDataset(obj=xr.Dataset(da), grids=grids)
 
-    # Assign the coordinate reference system to the data
-    uda_rescaled.grid.set_crs(uda.grid.crs)
-
     # Return the rescaled data
     return uda_rescaled
 
@@ -297,29 +351,42 @@ def _rescale_GeoDataFrame(gdf, scale_factor):
     if scale_factor == 1:
         return gdf
 
-    # Rescale the x and y dimensions
-    gdf_rescaled = gdf.copy()
-    gdf_rescaled["geometry"] = gdf_rescaled["geometry"].scale(xfact=scale_factor, yfact=scale_factor, zfact=1, origin=(0, 0))
+    # Rescale the x and y coordinates of all 2D geometries and all 3D geometries at once (z coordinates are kept, 2D geometries stay 2D)
+    geometry = np.asarray(gdf.geometry.values, dtype=object).copy()
+    has_z = shapely.has_z(geometry)
+    geometry[~has_z] = shapely.transform(geometry[~has_z], lambda coords: coords * scale_factor)
+    geometry[has_z] = shapely.transform(geometry[has_z], lambda coords: coords * np.array([scale_factor, scale_factor, 1]), include_z=True)
+
+    # Assign the rescaled geometries to a shallow copy of the geometries
+    gdf_rescaled = gdf.copy(deep=False)
+    gdf_rescaled[gdf.geometry.name] = gpd.GeoSeries(geometry, index=gdf.index, crs=gdf.crs)
 
     # Return the rescaled geometries
     return gdf_rescaled
 
 
-def get_rescale_parameters(data=None, crs=None, xy_unit=None):
-    """Get the scale factor, xlabel and ylabel for data, geometries or a coordinate reference system and unit.
+def _get_crs_key(data=None, crs=None):
+    """Get a canonical identity of the coordinate reference system of data, geometries or a coordinate reference system.
 
-    :param data:    Data or geometries to rescale. If ``None``, the crs is used to determine the rescale parameters.
-    :type data:     xarray.DataArray, xarray.Dataset, xugrid.UgridDataArray, xugrid.UgridDataset, geopandas.GeoDataFrame, optional
-    :param crs:     Coordinate reference system of the data. If ``None``, the crs is determined automatically based on the data.
-    :type crs:      pyproj.CRS or rasterio.CRS or str, optional
-    :param xy_unit: Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the data.
-    :type xy_unit:  str, optional
-    :return:        Scale factor, xlabel, ylabel.
-    :rtype:         tuple[float, str, str]
+    The identity is the string the coordinate reference system is defined by (e.g. ``"EPSG:28992"`` or WKT), so it can be used as a cache key
+    without parsing the coordinate reference system. For xarray data the WKT is read from the grid mapping coordinate if available.
+
+    :param data: Data or geometries. If ``None``, the crs is used.
+    :type data:  xarray.DataArray, xarray.Dataset, xugrid.UgridDataArray, xugrid.UgridDataset, geopandas.GeoDataFrame, optional
+    :param crs:  Coordinate reference system of the data. If ``None``, the crs is determined automatically based on the data.
+    :type crs:   pyproj.CRS or rasterio.CRS or str, optional
+    :return:     Identity of the coordinate reference system or ``None`` if no coordinate reference system.
+    :rtype:      str or None
     """
 
     # Get the coordiante reference system of the data
     if isinstance(data, xr.DataArray) or isinstance(data, xr.Dataset):
+        grid_mapping = data.encoding.get("grid_mapping", data.attrs.get("grid_mapping", "spatial_ref"))
+        grid_mapping_attrs = data.coords[grid_mapping].attrs if grid_mapping in data.coords else {}
+        if grid_mapping_attrs.get("spatial_ref"):
+            return grid_mapping_attrs["spatial_ref"]
+        elif grid_mapping_attrs.get("crs_wkt"):
+            return grid_mapping_attrs["crs_wkt"]
         crs = data.rio.crs
     elif isinstance(data, xu.UgridDataArray) or isinstance(data, xu.UgridDataset):
         crs = data.grid.crs
@@ -332,20 +399,50 @@ def get_rescale_parameters(data=None, crs=None, xy_unit=None):
             "data type not supported. Please provide a xarray.DataArray, xarray.Dataset, xugrid.UgridDataArray, xugrid.UgridDataset or geopandas.GeoDataFrame."
         )
 
-    # Convert the crs to a pyproj.CRS
+    # Get the identity of the crs
     if isinstance(crs, pyprojCRS):
-        crs = crs
+        return crs.srs
     elif isinstance(crs, rasterioCRS):
-        crs = pyprojCRS.from_string(crs.to_string())
+        return crs.to_string()
     elif isinstance(crs, str):
-        crs = pyprojCRS.from_string(crs)
+        return crs
     elif crs is None:
-        crs = crs
+        return None
     else:
         raise TypeError("crs type not supported. Please provide a pyproj.CRS, rasterio.CRS or str object.")
 
+
+@functools.lru_cache(maxsize=128)
+def _get_xy_attrs_from_crs_key(crs_key):
+    """Get the x and y attributes for the identity of a coordinate reference system, cached per identity.
+
+    :param crs_key: Identity of the coordinate reference system, see :func:`_get_crs_key`.
+    :type crs_key:  str or None
+    :return:        x and y attributes.
+    :rtype:         dict, dict
+    """
+
+    # Convert the crs identity to a pyproj.CRS
+    crs = pyprojCRS.from_string(crs_key) if crs_key is not None else None
+
+    # Return the x and y attributes
+    return _get_xy_attrs_from_crs(crs)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_rescale_parameters_from_crs_key(crs_key, xy_unit=None):
+    """Get the scale factor, xlabel and ylabel for the identity of a coordinate reference system and unit, cached per identity and unit.
+
+    :param crs_key: Identity of the coordinate reference system, see :func:`_get_crs_key`.
+    :type crs_key:  str or None
+    :param xy_unit: Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the crs.
+    :type xy_unit:  str, optional
+    :return:        Scale factor, xlabel, ylabel.
+    :rtype:         tuple[float, str, str]
+    """
+
     # Get x and y attributes and unit
-    x_attrs, y_attrs = _get_xy_attrs_from_crs(crs)
+    x_attrs, y_attrs = _get_xy_attrs_from_crs_key(crs_key)
 
     # Get the scale factor and corresponding x and y unit
     scale_factor, xy_unit_out = _get_scale_factor(xy_unit_in=x_attrs["unit"], xy_unit_out=xy_unit)
@@ -358,6 +455,25 @@ def get_rescale_parameters(data=None, crs=None, xy_unit=None):
     return scale_factor, xlabel, ylabel
 
 
+def get_rescale_parameters(data=None, crs=None, xy_unit=None):
+    """Get the scale factor, xlabel and ylabel for data, geometries or a coordinate reference system and unit.
+
+    The rescale parameters are cached per coordinate reference system and unit, so the coordinate reference system is only parsed once.
+
+    :param data:    Data or geometries to rescale. If ``None``, the crs is used to determine the rescale parameters.
+    :type data:     xarray.DataArray, xarray.Dataset, xugrid.UgridDataArray, xugrid.UgridDataset, geopandas.GeoDataFrame, optional
+    :param crs:     Coordinate reference system of the data. If ``None``, the crs is determined automatically based on the data.
+    :type crs:      pyproj.CRS or rasterio.CRS or str, optional
+    :param xy_unit: Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the data.
+    :type xy_unit:  str, optional
+    :return:        Scale factor, xlabel, ylabel.
+    :rtype:         tuple[float, str, str]
+    """
+
+    # Return the scale factor, xlabel, ylabel
+    return _get_rescale_parameters_from_crs_key(_get_crs_key(data=data, crs=crs), xy_unit)
+
+
 def get_xy_unit(data=None, crs=None):
     """Get the x and y unit for data, geometries or a coordinate reference system.
 
@@ -369,34 +485,8 @@ def get_xy_unit(data=None, crs=None):
     :rtype:      str
     """
 
-    # Get the coordiante reference system of the data
-    if isinstance(data, xr.DataArray) or isinstance(data, xr.Dataset):
-        crs = data.rio.crs
-    elif isinstance(data, xu.UgridDataArray) or isinstance(data, xu.UgridDataset):
-        crs = data.grid.crs
-    elif isinstance(data, gpd.GeoDataFrame):
-        crs = data.crs
-    elif data is None:
-        crs = crs
-    else:
-        raise TypeError(
-            "data type not supported. Please provide a xarray.DataArray, xarray.Dataset, xugrid.UgridDataArray, xugrid.UgridDataset or geopandas.GeoDataFrame."
-        )
-
-    # Convert the crs to a pyproj.CRS
-    if isinstance(crs, pyprojCRS):
-        crs = crs
-    elif isinstance(crs, rasterioCRS):
-        crs = pyprojCRS.from_string(crs.to_string())
-    elif isinstance(crs, str):
-        crs = pyprojCRS.from_string(crs)
-    elif crs is None:
-        crs = crs
-    else:
-        raise TypeError("crs type not supported. Please provide a pyproj.CRS, rasterio.CRS or str object.")
-
     # Get x and y attributes and unit
-    x_attrs, _ = _get_xy_attrs_from_crs(crs)
+    x_attrs, _ = _get_xy_attrs_from_crs_key(_get_crs_key(data=data, crs=crs))
 
     # Return the x and y unit
     return x_attrs["unit"]
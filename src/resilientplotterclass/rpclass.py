@@ -1,42 +1,126 @@
 # Packages
+import fnmatch
 import gc
+import glob
+import hashlib
 import html
-import inspect
 import json
 import os
+import pickle
+import re
+import sys
 
-import folium
 import geopandas as gpd
-import ipyleaflet
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import pandas as pd
 import xarray as xr
 import xugrid as xu
-from IPython.display import HTML, display
 from pyproj import CRS as pyprojCRS
 from rasterio.crs import CRS as rasterioCRS
 
 import resilientplotterclass as rpc
 
+# Define plot styles (names of the plot methods that get keyword arguments from the guidelines)
+PLOT_STYLES = ["pcolormesh", "imshow", "scatter", "contourf", "contour", "quiver", "streamplot", "grid", "geometries", "basemap", "cartopy"]
+
+# Define style parameters (guideline sections with keyword arguments per style)
+STYLE_PARAMETERS = [
+    "data_style",
+    "geom_style",
+    "map_style",
+    "extent_style",
+    "interactive_data_style",
+    "interactive_geom_style",
+    "interactive_map_style",
+    "interactive_extent_style",
+]
+
+
+# Define data attributes to get the data style from, in order of priority (see the data section of the guidelines)
+DATA_ATTRIBUTES = ["standard_name", "name", "long_name", "units"]
+
+# Define the version of the guidelines cache files (increase when the structure of the cached guidelines changes)
+_GUIDELINES_CACHE_VERSION = 5
+
+
+# Immutable dictionary
+class _FrozenDict(dict):
+    """Immutable dictionary for guidelines and guideline keyword arguments.
+
+    Subclass of :class:`dict`, so it can be passed wherever a dictionary is expected (e.g. ``**kwargs``). Methods that modify the dictionary
+    raise a TypeError. Use ``dict(frozen_dict)`` or ``{**frozen_dict}`` to get a modifiable copy.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("'{}' object is immutable".format(type(self).__name__))
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+# Freeze dictionary
+def _freeze(dict1):
+    """Recursively freeze dictionary.
+
+    :param dict1: Dictionary.
+    :type dict1:  dict
+    :return:      Immutable dictionary.
+    :rtype:       _FrozenDict
+    """
+
+    # Return immutable dictionary with frozen nested dictionaries
+    if isinstance(dict1, _FrozenDict):
+        return dict1
+    return _FrozenDict({key: _freeze(value) if isinstance(value, dict) else value for key, value in dict1.items()})
+
+
+# Check instance of a class from a lazily imported package
+def _isinstance_lazy(obj, module_name, class_name):
+    """Check if an object is an instance of a class without importing the module of the class.
+
+    Interactive packages (e.g. folium and ipyleaflet) are only imported when they are used. If the module is not imported yet, the object
+    cannot be an instance of the class.
+
+    :param obj:         Object to check.
+    :type obj:          object
+    :param module_name: Name of the module of the class.
+    :type module_name:  str
+    :param class_name:  Name of the class.
+    :type class_name:   str
+    :return:            True if the object is an instance of the class.
+    :rtype:             bool
+    """
+
+    # Get the module if it is imported
+    module = sys.modules.get(module_name)
+
+    # Return whether the object is an instance of the class
+    return module is not None and isinstance(obj, getattr(module, class_name))
+
 
 # Resilient Plotter Class
 class rpclass:
     # =============================================================================
     # Constructor
     # =============================================================================
-    def __init__(self, project_guidelines=None, cartopy=False):
+    def __init__(self, project_guidelines=None, cartopy=False, cache_guidelines=True):
         """Constructor for the resilient plotter class.
 
         :param project_guidelines: File path to the project guidelines file or dictionary with project guidelines.
         :type project_guidelines:  str, optional
         :param cartopy:            Set cartopy geometries.
         :type cartopy:             bool, optional
+        :param cache_guidelines:   Read and write the guidelines from and to the cache file, see :meth:`set_guidelines`.
+        :type cache_guidelines:    bool, optional
         :return:                   None.
         :rtype:                    None
         """
 
         # Set guidelines
-        self.set_guidelines(project_guidelines)
+        self.set_guidelines(project_guidelines, cache=cache_guidelines)
 
         # Set cartopy geometries
         if cartopy:
@@ -44,11 +128,6 @@ class rpclass:
         else:
             self.gdf_cartopy = None
 
-        # Register colormaps
-        rpc.colormaps.register_colormaps()
-        import cmocean.cm as cmo  # noqa: F401
-        import colorcet as cc  # noqa: F401
-
     # =============================================================================
     # Guideline support methods
     # =============================================================================
@@ -56,6 +135,9 @@ class rpclass:
     def _combine_dictionaries(self, dict1, dict2, max_depth=4):
         """Recursively combine dictionaries, prioritising dictionary 2.
 
+        The dictionaries are not modified. Only dictionaries with keys in both dictionaries are copied, other values (e.g. nested immutable
+        guideline dictionaries) are shared with the combined dictionary.
+
         :param dict1:     Dictionary 1.
         :type dict1:      dict
         :param dict2:     Dictionary 2.
@@ -82,28 +164,23 @@ class rpclass:
         elif not isinstance(dict2, dict):
             return dict1
 
-        # Both dictionaries are dictionaries --> combine dictionaries
-        keys = list(dict1.keys()) + list(dict2.keys())
-        dict3 = {}
-        for key in keys:
-            # Key not in dictionary 1 --> use dictionary 2
-            if key not in dict1.keys():
-                dict3[key] = dict2[key]
-
-            # Key not in dictionary 2 --> use dictionary 1
-            elif key not in dict2.keys():
-                dict3[key] = dict1[key]
+        # One of the dictionaries is empty --> return the other dictionary
+        elif not dict2:
+            return dict1
+        elif not dict1:
+            return dict2
 
-            # Key in both dictionaries --> combine dictionaries
-            else:
-                dict3[key] = self._combine_dictionaries(dict1[key], dict2[key], max_depth=max_depth - 1)
+        # Both dictionaries are dictionaries --> overlay dictionary 2 on dictionary 1 and combine values of keys in both dictionaries
+        dict3 = {**dict1, **dict2}
+        for key in dict1.keys() & dict2.keys():
+            dict3[key] = self._combine_dictionaries(dict1[key], dict2[key], max_depth=max_depth - 1)
 
         # Return combined dictionary
         return dict3
 
     # Substitute string in dictionary
     def _substitute_str_in_dict(self, dict1, org_str=None, new_str=None):
-        """Recursively substitute string in dictionary.
+        """Recursively substitute string in dictionary, without modifying the dictionary.
 
         :param dict1:   Dictionary.
         :type dict1:    dict
@@ -120,27 +197,32 @@ class rpclass:
             return dict1
 
         # Substitute string in dictionary
+        dict2 = {}
         for key, value in dict1.items():
             if isinstance(value, dict):
-                dict1[key] = self._substitute_str_in_dict(value, org_str, new_str)
+                dict2[key] = self._substitute_str_in_dict(value, org_str, new_str)
             elif isinstance(value, str):
-                dict1[key] = value.replace(org_str, new_str)
+                dict2[key] = value.replace(org_str, new_str)
+            else:
+                dict2[key] = value
 
         # Return dictionary with substituted strings
-        return dict1
+        return dict2
 
     # Remove conflicting kwargs
-    def _remove_conflicting_kwargs(self, dict1, plot_style=None, warn=True, reverse=True):
+    def _remove_conflicting_kwargs(self, dict1, plot_style=None, warn=True, reverse=True, remove_cbar_kwargs=True):
         """Remove conflicting kwargs from dictionary, prioritising the last kwargs.
 
-        :param dict1:     Dictionary.
-        :type dict1:      dict
-        :param plot_style: Plot style.
-        :type plot_style:  str
-        :param warn:      Print warning if conflicting kwargs.
-        :type warn:       bool, optional
-        :return:          Dictionary without conflicting kwargs.
-        :rtype:           dict
+        :param dict1:              Dictionary.
+        :type dict1:               dict
+        :param plot_style:         Plot style.
+        :type plot_style:          str
+        :param warn:               Print warning if conflicting kwargs.
+        :type warn:                bool, optional
+        :param remove_cbar_kwargs: Remove colorbar keyword arguments if no colorbar is added.
+        :type remove_cbar_kwargs:  bool, optional
+        :return:                   Dictionary without conflicting kwargs.
+        :rtype:                    dict
         """
 
         # Check if dictionary must be reversed
@@ -161,8 +243,9 @@ class rpclass:
                 print("\033[93m Warning: Conflicting kwargs ('{}' and '{}') using '{}'. \033[0m".format(key2, key, key2))
 
         # Remove conflicting kwargs for colorbar
-        if ("add_colorbar" in dict2.keys() and not dict2["add_colorbar"]) or (
-            plot_style in ["contour", "quiver", "streamplot"] and "add_colorbar" not in dict2.keys()
+        if remove_cbar_kwargs and (
+            ("add_colorbar" in dict2.keys() and not dict2["add_colorbar"])
+            or (plot_style in ["contour", "quiver", "streamplot"] and "add_colorbar" not in dict2.keys())
         ):
             if "cbar_kwargs" in dict2.keys():
                 dict2.pop("cbar_kwargs")
@@ -171,10 +254,134 @@ class rpclass:
         # Return dictionary without conflicting kwargs
         return dict2
 
-    # Get keyword arguments
-    def _get_kwargs(self, data_style=None, geom_style=None, map_style=None, extent_style=None, interactive=False, show_kwargs=False, **kwargs):
-        """Get keyword arguments.
+    # Resolve guideline inheritance
+    def _resolve_guideline_inheritance(self, guidelines):
+        """Resolve guideline inheritance ("extends") in the style parameters of the guidelines.
+
+        An argument can extend another argument of the same style parameter (e.g. ``"bathymetry": {"extends": "default"}``). A plot style of a
+        data style can extend another plot style of the same argument (e.g. ``"imshow": {"extends": "pcolormesh"}``) or a plot style of another
+        argument (e.g. ``"imshow": {"extends": "default.pcolormesh"}``). The extending guideline is combined with the extended guideline,
+        prioritising the extending guideline. Each guideline is resolved once, so nested inheritance does not add to the cost of later lookups.
+
+        :param guidelines: Guidelines.
+        :type guidelines:  dict
+        :return:           Guidelines with resolved inheritance.
+        :rtype:            dict
+        """
 
+        # Resolve inheritance of a guideline
+        def _resolve(parameter, guidelines_parameter, key, resolved, resolving):
+            # Guideline already resolved --> return resolved guideline
+            if key in resolved:
+                return resolved[key]
+
+            # Guideline is being resolved --> raise error for cyclic inheritance
+            if key in resolving:
+                cycle = [".".join(key_) for key_ in resolving[resolving.index(key) :] + [key]]
+                raise ValueError("Cyclic inheritance in {}: {}".format(parameter, " -> ".join(cycle)))
+
+            # Get guideline and guideline without inheritance
+            guideline = guidelines_parameter[key[0]] if len(key) == 1 else guidelines_parameter[key[0]][key[1]]
+            if not isinstance(guideline, dict):
+                resolved[key] = guideline
+                return guideline
+            extends = guideline.get("extends")
+            guideline = {key_: value for key_, value in guideline.items() if key_ != "extends"}
+
+            # Combine guideline with extended guideline, prioritising guideline
+            if extends is not None:
+                if len(key) == 1:
+                    extended_key = (extends,)
+                else:
+                    extended_key = tuple(extends.split(".", 1)) if "." in extends else (key[0], extends)
+                if extended_key[0] not in guidelines_parameter.keys() or (
+                    len(extended_key) == 2 and extended_key[1] not in guidelines_parameter[extended_key[0]].keys()
+                ):
+                    raise ValueError("{} '{}' extends '{}', which is not in guidelines.".format(parameter, ".".join(key), extends))
+                resolving.append(key)
+                guideline = self._combine_dictionaries(_resolve(parameter, guidelines_parameter, extended_key, resolved, resolving), guideline)
+                resolving.pop()
+
+            # Return resolved guideline
+            resolved[key] = guideline
+            return guideline
+
+        # Resolve inheritance of arguments and plot styles
+        guidelines = dict(guidelines)
+        for parameter in STYLE_PARAMETERS:
+            if not isinstance(guidelines.get(parameter), dict):
+                continue
+
+            # Resolve inheritance of arguments
+            resolved = {}
+            guidelines_parameter = {
+                argument: _resolve(parameter, guidelines[parameter], (argument,), resolved, []) for argument in guidelines[parameter]
+            }
+
+            # Resolve inheritance of plot styles
+            if parameter in ["data_style", "interactive_data_style"]:
+                resolved = {}
+                guidelines_parameter = {
+                    argument: {
+                        plot_style: _resolve(parameter, guidelines_parameter, (argument, plot_style), resolved, []) for plot_style in guideline
+                    }
+                    for argument, guideline in guidelines_parameter.items()
+                }
+            guidelines[parameter] = guidelines_parameter
+
+        # Return guidelines with resolved inheritance
+        return guidelines
+
+    # Replace guidelines that extend other guidelines in the project guidelines
+    def _replace_extending_guidelines(self, guidelines, project_guidelines, source_guidelines):
+        """Replace guidelines that extend another guideline in the project guidelines (``"extends"``) by the guidelines of a source.
+
+        Inheritance is resolved within the default guidelines before the project guidelines are combined with them, so a project guideline only
+        changes the guidelines it sets (e.g. a project ``pcolormesh`` guideline does not change the ``imshow`` guideline that extends it in the
+        default guidelines). A project guideline that extends another guideline replaces the default guideline instead of being combined with it.
+
+        :param guidelines:         Guidelines to replace guidelines in. The guidelines are not modified.
+        :type guidelines:          dict
+        :param project_guidelines: Project guidelines.
+        :type project_guidelines:  dict
+        :param source_guidelines:  Guidelines to get the replacing guidelines from.
+        :type source_guidelines:   dict
+        :return:                   Guidelines with replaced guidelines.
+        :rtype:                    dict
+        """
+
+        # Function to check if a guideline extends another guideline
+        def _extends(guideline):
+            return isinstance(guideline, dict) and guideline.get("extends") is not None
+
+        # Replace guidelines of arguments and plot styles
+        guidelines = dict(guidelines)
+        for parameter in STYLE_PARAMETERS:
+            if not isinstance(project_guidelines.get(parameter), dict):
+                continue
+            guidelines[parameter] = dict(guidelines.get(parameter, {}))
+            for argument, guideline in project_guidelines[parameter].items():
+                # Replace guideline of argument
+                if _extends(guideline):
+                    guidelines[parameter][argument] = source_guidelines[parameter][argument]
+                    continue
+
+                # Replace guidelines of plot styles
+                if parameter in ["data_style", "interactive_data_style"] and isinstance(guideline, dict):
+                    for plot_style, guideline_plot_style in guideline.items():
+                        if _extends(guideline_plot_style):
+                            guidelines[parameter][argument] = dict(guidelines[parameter].get(argument, {}))
+                            guidelines[parameter][argument][plot_style] = source_guidelines[parameter][argument][plot_style]
+
+        # Return guidelines with replaced guidelines
+        return guidelines
+
+    # Get guideline keyword arguments
+    def _get_guideline_kwargs(self, plot_style, data_style=None, geom_style=None, map_style=None, extent_style=None, interactive=False):
+        """Get guideline keyword arguments by combining the guidelines of the data, geometry, map and extent types.
+
+        :param plot_style:   Plot style (name of the plot method), see :data:`PLOT_STYLES`.
+        :type plot_style:    str
         :param data_style:   Data type from guidelines.
         :type data_style:    str, optional
         :param geom_style:   Geometry type from guidelines.
@@ -185,13 +392,10 @@ class rpclass:
         :type extent_style:  str, optional
         :param interactive:  Interactive plot.
         :type interactive:   bool, optional
-        :param show_kwargs:  Show keyword arguments.
-        :type show_kwargs:   bool, optional
-        :param kwargs:       Keyword arguments.
-        :type kwargs:        dict, optional
-        :return:             Keyword arguments.
+        :return:             Guideline keyword arguments.
         :rtype:              dict
         """
+
         # Get parameters and arguments
         parameters, arguments = [], []
         if data_style is not None:
@@ -207,37 +411,110 @@ class rpclass:
             parameters.append("extent_style" if not interactive else "interactive_extent_style")
             arguments.append(extent_style)
 
-        # Get plot type (name of the function calling this method)
-        plot_style = inspect.stack()[1].function
-
-        # Get guidelines
+        # Get compiled guidelines
         guideline_kwargs_ls = []
         for parameter, argument in zip(parameters, arguments):
+            key = (parameter, argument, plot_style if parameter in ["data_style", "interactive_data_style"] else None)
+            if key in self._compiled_guidelines:
+                guideline_kwargs_ls.append(self._compiled_guidelines[key])
+                continue
+
             # Check if parameter and argument are in guidelines
             if parameter not in self.guidelines.keys():
                 raise ValueError("{} not in guidelines. Available: {}".format(parameter, list(self.guidelines.keys())))
             if argument not in self.guidelines[parameter].keys():
                 raise ValueError("{} '{}' not in guidelines. Available: {}".format(parameter, argument, list(self.guidelines[parameter].keys())))
 
-            if parameter in ["data_style", "interactive_data_style"]:
-                # Check if plot_style is in guidelines
-                if plot_style not in self.guidelines[parameter][argument].keys():
-                    raise ValueError(
-                        "plot_style {} not in guidelines. Available: {}".format(plot_style, list(self.guidelines[parameter][argument].keys()))
-                    )
-                guideline_kwargs_ls.append(self.guidelines[parameter][argument][plot_style].copy())
-            else:
-                guideline_kwargs_ls.append(self.guidelines[parameter][argument].copy())
+            # Check if plot_style is in guidelines
+            raise ValueError("plot_style {} not in guidelines. Available: {}".format(plot_style, list(self.guidelines[parameter][argument].keys())))
 
-        # Combine guidelines and user keyword arguments, prioritising user keyword arguments
+        # Combine guidelines, prioritising the guidelines of the data, geometry, map and extent types in that order
+        guideline_kwargs = {}
+        for guideline_kwargs_ in guideline_kwargs_ls:
+            guideline_kwargs = self._combine_dictionaries(guideline_kwargs_, guideline_kwargs)
+
+        # Return immutable guideline keyword arguments
+        return _freeze(guideline_kwargs)
+
+    # Compile guidelines
+    def _compile_guidelines(self, guidelines):
+        """Compile guidelines into a flat lookup table of immutable guideline keyword arguments.
+
+        Data styles are compiled per plot style with key ``(parameter, argument, plot_style)``. Other styles apply to all plot styles and are
+        compiled with key ``(parameter, argument, None)``. Conflicting kwargs are removed, prioritising the last kwargs as in :meth:`_get_kwargs`.
+        The compiled guidelines only contain builtin types and immutable dictionaries, so they can be pickled (e.g. for worker processes).
+
+        :param guidelines: Guidelines with substituted strings.
+        :type guidelines:  dict
+        :return:           Compiled guidelines.
+        :rtype:            dict
+        """
+
+        # Compile guidelines
+        compiled_guidelines = {}
+        for parameter in STYLE_PARAMETERS:
+            for argument, guideline in guidelines.get(parameter, {}).items():
+                if parameter in ["data_style", "interactive_data_style"]:
+                    guideline_kwargs_dict = {(parameter, argument, plot_style): kwargs for plot_style, kwargs in guideline.items()}
+                else:
+                    guideline_kwargs_dict = {(parameter, argument, None): guideline}
+                for key, kwargs in guideline_kwargs_dict.items():
+                    kwargs_ = self._remove_conflicting_kwargs(kwargs, warn=False, remove_cbar_kwargs=False)
+                    compiled_guidelines[key] = _freeze({key_: value for key_, value in kwargs.items() if key_ in kwargs_})
+
+        # Return compiled guidelines
+        return compiled_guidelines
+
+    # Get keyword arguments
+    def _get_kwargs(
+        self, plot_style, data_style=None, geom_style=None, map_style=None, extent_style=None, interactive=False, show_kwargs=False, **kwargs
+    ):
+        """Get keyword arguments.
+
+        :param plot_style:   Plot style (name of the plot method), see :data:`PLOT_STYLES`.
+        :type plot_style:    str
+        :param data_style:   Data type from guidelines.
+        :type data_style:    str, optional
+        :param geom_style:   Geometry type from guidelines.
+        :type geom_style:    str, optional
+        :param map_style:    Map type from guidelines.
+        :type map_style:     str, optional
+        :param extent_style: Extent type from guidelines.
+        :type extent_style:  str, optional
+        :param interactive:  Interactive plot.
+        :type interactive:   bool, optional
+        :param show_kwargs:  Show keyword arguments.
+        :type show_kwargs:   bool, optional
+        :param kwargs:       Keyword arguments.
+        :type kwargs:        dict, optional
+        :return:             Keyword arguments.
+        :rtype:              dict
+        """
+        # Check if plot style is supported
+        if plot_style not in PLOT_STYLES:
+            raise ValueError("plot_style '{}' not supported. Available: {}".format(plot_style, PLOT_STYLES))
+
+        # Get guideline keyword arguments from cache or combine guidelines (the cache is replaced by set_guidelines after the guidelines)
+        kwargs_cache = self._kwargs_cache
+        key = (plot_style, data_style, geom_style, map_style, extent_style, interactive)
+        guideline_kwargs = kwargs_cache.get(key)
+        if guideline_kwargs is None:
+            guideline_kwargs = self._get_guideline_kwargs(plot_style, data_style, geom_style, map_style, extent_style, interactive)
+            kwargs_cache[key] = guideline_kwargs
+
+        # Overlay user keyword arguments on the immutable guideline keyword arguments, prioritising user keyword arguments
         if not interactive:
             kwargs.setdefault("xy_unit", self.guidelines["general"]["xy_unit"])
-        for guideline_kwargs in guideline_kwargs_ls:
-            kwargs = self._combine_dictionaries(guideline_kwargs, kwargs)
+            kwargs.setdefault("rescale_mode", self.guidelines["general"]["rescale_mode"])
+        kwargs = self._combine_dictionaries(guideline_kwargs, kwargs)
 
         # Remove conflicting kwargs
         kwargs = self._remove_conflicting_kwargs(kwargs, plot_style)
 
+        # Register colormap on first use
+        if isinstance(kwargs.get("cmap"), str):
+            rpc.colormaps.register_colormap(kwargs["cmap"])
+
         # Show keyword arguments
         if show_kwargs:
             print("Keyword arguments for {}: {}".format(plot_style, kwargs))
@@ -245,6 +522,161 @@ class rpclass:
         # Return keyword arguments
         return kwargs
 
+    # Get data style index
+    def _get_data_style_index(self, guidelines):
+        """Get index of the data section of the guidelines to get data styles from data attributes.
+
+        The data section maps data styles to values of the data attributes (see :data:`DATA_ATTRIBUTES`), e.g.
+        ``"bathymetry": {"standard_name": ["sea_floor_depth_below_geoid"], "name": ["bedlevel", "*_bl"]}``. Values are matched case-insensitive.
+        Values with wildcards (``*``, ``?`` and ``[``) are :mod:`fnmatch` patterns, which are combined into one regular expression per attribute.
+
+        :param guidelines: Guidelines.
+        :type guidelines:  dict
+        :return:           Data style index with exact values, pattern and data styles of the pattern groups per data attribute.
+        :rtype:            dict
+        """
+
+        # Get exact values and patterns per data attribute
+        data_style_index = {}
+        for attribute in DATA_ATTRIBUTES:
+            exact_values, patterns, pattern_data_styles = {}, [], []
+            for data_style, data_guideline in guidelines.get("data", {}).items():
+                values = data_guideline.get(attribute, []) if isinstance(data_guideline, dict) else []
+                for value in [values] if isinstance(values, str) else values:
+                    if any(char in value for char in "*?["):
+                        patterns.append("(?P<_{}>{})".format(len(patterns), fnmatch.translate(value.lower())))
+                        pattern_data_styles.append(data_style)
+                    else:
+                        exact_values.setdefault(value.lower(), data_style)
+            pattern = re.compile("|".join(patterns)) if patterns else None
+            data_style_index[attribute] = (exact_values, pattern, pattern_data_styles)
+
+        # Return data style index
+        return data_style_index
+
+    # Get data style from data attributes
+    def _get_data_style(self, data, plot_style, interactive=False):
+        """Get data style from the data attributes using the data section of the guidelines.
+
+        The data attributes are matched in order of :data:`DATA_ATTRIBUTES`, exact values before patterns. The data style is only returned if it
+        has guidelines for the plot style. Results are cached per combination of data attributes until the guidelines are set again.
+
+        :param data:        Data.
+        :type data:         xarray.DataArray, xarray.Dataset or xugrid.UgridDataArray
+        :param plot_style:  Plot style (name of the plot method), see :data:`PLOT_STYLES`.
+        :type plot_style:   str
+        :param interactive: Interactive plot.
+        :type interactive:  bool, optional
+        :return:            Data style or None if no data style matches.
+        :rtype:             str or None
+        """
+
+        # Get data attributes
+        attrs = getattr(data, "attrs", {})
+        values = [attrs.get(attribute) if attribute != "name" else getattr(data, "name", None) for attribute in DATA_ATTRIBUTES]
+        values = tuple(value.lower() if isinstance(value, str) else None for value in values)
+
+        # Get data style from cache
+        key = (values, plot_style, interactive)
+        if key in self._data_style_cache:
+            return self._data_style_cache[key]
+
+        # Get data style from data style index
+        data_style = None
+        for attribute, value in zip(DATA_ATTRIBUTES, values):
+            if value is None:
+                continue
+            exact_values, pattern, pattern_data_styles = self._data_style_index[attribute]
+            data_style = exact_values.get(value)
+            if data_style is None and pattern is not None:
+                match = pattern.match(value)
+                data_style = pattern_data_styles[int(match.lastgroup[1:])] if match is not None else None
+            if data_style is not None:
+                break
+
+        # Check if data style has guidelines for plot style
+        parameter = "data_style" if not interactive else "interactive_data_style"
+        if (parameter, data_style, plot_style) not in self._compiled_guidelines:
+            data_style = None
+
+        # Return data style
+        self._data_style_cache[key] = data_style
+        return data_style
+
+    # Get file path to the guidelines cache file
+    def _get_file_path_guidelines_cache(self, file_paths_guidelines):
+        """Get file path to the guidelines cache file.
+
+        :param file_paths_guidelines: File paths to the guidelines files.
+        :type file_paths_guidelines:  list[str]
+        :return:                      File path to the guidelines cache file.
+        :rtype:                       str
+        """
+
+        # Get hash of the file paths and hash of the modification times, sizes, package version and cache version
+        file_paths_guidelines = [os.path.abspath(file_path) for file_path in file_paths_guidelines]
+        file_stats = [os.stat(file_path) for file_path in file_paths_guidelines]
+        stamps = [(file_stat.st_mtime_ns, file_stat.st_size) for file_stat in file_stats] + [rpc.__version__, _GUIDELINES_CACHE_VERSION]
+        hash_paths = hashlib.sha1(repr(file_paths_guidelines).encode()).hexdigest()[:16]
+        hash_stamps = hashlib.sha1(repr(stamps).encode()).hexdigest()[:16]
+
+        # Return file path to the cache file
+        return os.path.join(mpl.get_cachedir(), "resilientplotterclass", "guidelines", "{}-{}.pkl".format(hash_paths, hash_stamps))
+
+    # Read guidelines cache file
+    def _read_guidelines_cache(self, file_path_cache):
+        """Read guidelines from the guidelines cache file.
+
+        :param file_path_cache: File path to the guidelines cache file.
+        :type file_path_cache:  str
+        :return:                Guidelines, compiled guidelines, default guidelines and project guidelines, or None if not cached or if the cache
+                                file is outdated or corrupt.
+        :rtype:                 tuple[dict] or None
+        """
+
+        # Read guidelines from the cache file (outdated pickles can raise any of these errors, the guidelines are recomputed instead)
+        if os.path.exists(file_path_cache):
+            try:
+                with open(file_path_cache, "rb") as f:
+                    guidelines_cache = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+                return None
+
+            # Return guidelines if the cache has the expected structure
+            if isinstance(guidelines_cache, tuple) and len(guidelines_cache) == 4 and all(isinstance(item, dict) for item in guidelines_cache):
+                return guidelines_cache
+
+        # Return None if not cached
+        return None
+
+    # Write guidelines cache file
+    def _write_guidelines_cache(self, file_path_cache, guidelines_cache):
+        """Write guidelines to the guidelines cache file, replacing outdated cache files.
+
+        If the cache directory is not writable, the guidelines are not cached.
+
+        :param file_path_cache:  File path to the guidelines cache file.
+        :type file_path_cache:   str
+        :param guidelines_cache: Guidelines, compiled guidelines, default guidelines and project guidelines.
+        :type guidelines_cache:  tuple[dict]
+        :return:                 None.
+        :rtype:                  None
+        """
+
+        # Write guidelines to the cache file, replacing outdated cache files
+        dir_path_cache = os.path.dirname(file_path_cache)
+        try:
+            os.makedirs(dir_path_cache, exist_ok=True)
+            hash_paths = os.path.basename(file_path_cache).split("-")[0]
+            for file_path_outdated in glob.glob(os.path.join(dir_path_cache, "{}-*.pkl".format(hash_paths))):
+                os.remove(file_path_outdated)
+            file_path_tmp = "{}.{}.tmp".format(file_path_cache, os.getpid())
+            with open(file_path_tmp, "wb") as f:
+                pickle.dump(guidelines_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file_path_tmp, file_path_cache)
+        except OSError:
+            pass
+
     # Show guideline levels
     def _show_guideline_levels(self, dict1, level, indent):
         """Recursively show guideline levels.
@@ -343,32 +775,10 @@ class rpclass:
         # Initialise lists
         parameters = []
         arguments = []
-        methods = {
-            "pcolormesh": [],
-            "imshow": [],
-            "scatter": [],
-            "contourf": [],
-            "contour": [],
-            "quiver": [],
-            "streamplot": [],
-            "grid": [],
-            "geometries": [],
-            "basemap": [],
-            "cartopy": [],
-        }
+        methods = {plot_style: [] for plot_style in PLOT_STYLES}
 
         # Add parameters, arguments and methods
-        styles = [
-            "data_style",
-            "geom_style",
-            "map_style",
-            "extent_style",
-            "interactive_data_style",
-            "interactive_geom_style",
-            "interactive_map_style",
-            "interactive_extent_style",
-        ]
-        for parameter in styles:
+        for parameter in STYLE_PARAMETERS:
             if parameter not in guidelines.keys():
                 continue
             for argument in guidelines[parameter]:
@@ -384,7 +794,7 @@ class rpclass:
         df_guideline_origins = df_guideline_origins.set_index(["parameter", "argument"])
 
         # Reindex dataframe
-        df_guideline_origins = df_guideline_origins.reindex(styles, level=0)
+        df_guideline_origins = df_guideline_origins.reindex(STYLE_PARAMETERS, level=0)
 
         # Return dataframe
         return df_guideline_origins
@@ -393,25 +803,28 @@ class rpclass:
     # Guidelines methods
     # =============================================================================
     # Set guidelines
-    def set_guidelines(self, project_guidelines=None):
+    def set_guidelines(self, project_guidelines=None, cache=True):
         """Set guidelines.
 
+        The combined and compiled guidelines are cached in the matplotlib cache directory. The cache file is keyed by the file paths, modification
+        times and sizes of the guidelines files and the package version, so it is rebuilt when a guidelines file changes. Project guidelines
+        provided as a dictionary are not cached.
+
         :param project_guidelines: File path to the project guidelines file or dictionary with project guidelines.
         :type project_guidelines:  str or dict, optional
+        :param cache:              Read and write the guidelines from and to the cache file.
+        :type cache:               bool, optional
         :return:                   None.
         :rtype:                    None
         """
 
-        # Read default guidelines
+        # Get file path to default guidelines
         dir_path_guidelines = os.path.join(os.path.dirname(os.path.abspath(__file__)), "guidelines")
-        with open(os.path.join(dir_path_guidelines, "default.json")) as f:
-            default_guidelines = json.load(f)
-
-        # Read project guidelines
-        if project_guidelines is None:
-            project_guidelines = {}
-        elif isinstance(project_guidelines, dict):
-            project_guidelines = project_guidelines
+        file_paths_guidelines = [os.path.join(dir_path_guidelines, "default.json")]
+
+        # Get file path to project guidelines
+        if project_guidelines is None or isinstance(project_guidelines, dict):
+            pass
         elif isinstance(project_guidelines, str):
             __, ext = os.path.splitext(project_guidelines)
             if ext == "":
@@ -420,30 +833,68 @@ class rpclass:
                 raise ValueError("Project guidelines must be a json file. Received: {}".format(ext))
             if os.path.exists(os.path.join(dir_path_guidelines, project_guidelines)) and not os.path.exists(project_guidelines):
                 project_guidelines = os.path.join(dir_path_guidelines, project_guidelines)
-            with open(project_guidelines) as f:
-                project_guidelines = json.load(f)
+            file_paths_guidelines.append(project_guidelines)
         else:
             raise ValueError("Project guidelines must be a file path (str) or a dictionary (dict). Received: {}".format(type(project_guidelines)))
 
-        # Combine guidelines, prioritising project guidelines
-        guidelines = self._combine_dictionaries(default_guidelines, project_guidelines)
+        # Read guidelines from the cache file
+        file_path_cache = self._get_file_path_guidelines_cache(file_paths_guidelines) if cache and not isinstance(project_guidelines, dict) else None
+        guidelines_cache = self._read_guidelines_cache(file_path_cache) if file_path_cache is not None else None
 
-        # Substitute strings in guidelines
-        guidelines = self._substitute_str_in_dict(guidelines, "@vrl", guidelines["general"]["vrl"])
+        if guidelines_cache is not None:
+            guidelines, compiled_guidelines, default_guidelines, project_guidelines = guidelines_cache
+        else:
+            # Read default guidelines
+            with open(file_paths_guidelines[0]) as f:
+                default_guidelines = json.load(f)
 
-        # Remove conflicting kwargs from guidelines
-        guidelines = self._remove_conflicting_kwargs(guidelines, warn=False, reverse=False)
+            # Read project guidelines
+            if project_guidelines is None:
+                project_guidelines = {}
+            elif isinstance(project_guidelines, str):
+                with open(project_guidelines) as f:
+                    project_guidelines = json.load(f)
 
-        # Set guidelines
-        self.guidelines = guidelines
+            # Combine guidelines with resolved inheritance within the default guidelines, prioritising project guidelines
+            guidelines = self._combine_dictionaries(self._resolve_guideline_inheritance(default_guidelines), project_guidelines)
 
-        # Set guideline origins dataframe
-        self._df_guideline_origins = self._get_df_guideline_origins(guidelines, default_guidelines, project_guidelines)
+            # Resolve guideline inheritance of the project guidelines
+            guidelines = self._replace_extending_guidelines(guidelines, project_guidelines, project_guidelines)
+            guidelines = self._resolve_guideline_inheritance(guidelines)
+
+            # Substitute strings in guidelines
+            guidelines = self._substitute_str_in_dict(guidelines, "@vrl", guidelines["general"]["vrl"])
+
+            # Freeze and compile guidelines
+            guidelines = _freeze(guidelines)
+            compiled_guidelines = self._compile_guidelines(guidelines)
+
+            # Write guidelines to the cache file
+            if file_path_cache is not None:
+                self._write_guidelines_cache(file_path_cache, (guidelines, compiled_guidelines, default_guidelines, project_guidelines))
+
+        # Set immutable guidelines
+        self.guidelines = _freeze(guidelines)
+        self._compiled_guidelines = compiled_guidelines
+
+        # Reset cache of guideline keyword arguments
+        self._kwargs_cache = {}
+
+        # Set data style index and reset cache of data styles
+        self._data_style_index = self._get_data_style_index(self.guidelines)
+        self._data_style_cache = {}
+
+        # Reset guideline origins dataframe (created on first use by show_guideline_origins)
+        self._default_guidelines = default_guidelines
+        self._project_guidelines = project_guidelines
+        self._df_guideline_origins = None
 
     # Get guidelines
     def get_guidelines(self):
         """Get guidelines.
 
+        The guidelines are immutable, use :meth:`set_guidelines` to change the guidelines.
+
         :return: Guidelines.
         :rtype:  dict
         """
@@ -459,6 +910,8 @@ class rpclass:
         :rtype:  None
         """
 
+        from IPython.display import HTML, display
+
         # Set open
         open = "open" if open else "closed"
 
@@ -481,9 +934,19 @@ class rpclass:
         :rtype:  None
         """
 
+        from IPython.display import display
+
         # Show guidelines
         self.show_guidelines(open=False)
 
+        # Get guideline origins dataframe (cached until the guidelines are set again)
+        if self._df_guideline_origins is None:
+            vrl = self.guidelines["general"]["vrl"]
+            default_guidelines = self._substitute_str_in_dict(self._resolve_guideline_inheritance(self._default_guidelines), "@vrl", vrl)
+            project_guidelines = self._replace_extending_guidelines(self._project_guidelines, self._project_guidelines, self.guidelines)
+            project_guidelines = self._substitute_str_in_dict(project_guidelines, "@vrl", vrl)
+            self._df_guideline_origins = self._get_df_guideline_origins(self.guidelines, default_guidelines, project_guidelines)
+
         # Show guideline origins dataframe
         style = self._df_guideline_origins.style
         for _, df_group in self._df_guideline_origins.groupby(level=0):
@@ -571,6 +1034,8 @@ class rpclass:
         See also: `folium.Map() <https://python-visualization.github.io/folium/modules.html#folium.folium.Map>`_
         """
 
+        import folium
+
         # Create map
         m = folium.Map(**kwargs)
 
@@ -611,7 +1076,7 @@ class rpclass:
         fig = m if fig is None else fig
         if isinstance(fig, plt.Figure):
             interactive = False
-        elif isinstance(fig, folium.Map) or isinstance(fig, ipyleaflet.Map):
+        elif _isinstance_lazy(fig, "folium", "Map") or _isinstance_lazy(fig, "ipyleaflet", "Map"):
             interactive = True
         else:
             raise TypeError("fig must be a matplotlib.figure.Figure, folium.Map or ipyleaflet.Map Received: {}".format(type(fig)))
@@ -621,9 +1086,15 @@ class rpclass:
             fig.tight_layout()
             plt.show(**kwargs)
         else:
-            if isinstance(fig, folium.Map):
+            from IPython.display import display
+
+            if _isinstance_lazy(fig, "folium", "Map"):
+                import folium
+
                 folium.LayerControl().add_to(m)
             else:
+                import ipyleaflet
+
                 m.add(ipyleaflet.LayersControl(position="topright"))
             display(m)
 
@@ -648,7 +1119,7 @@ class rpclass:
         fig = m if fig is None else fig
         if isinstance(fig, plt.Figure):
             interactive = False
-        elif isinstance(fig, folium.Map):
+        elif _isinstance_lazy(fig, "folium", "Map"):
             interactive = True
         else:
             raise TypeError("fig must be a matplotlib.figure.Figure or folium.Map. Received: {}".format(type(fig)))
@@ -681,7 +1152,7 @@ class rpclass:
         fig = m if fig is None else fig
         if isinstance(fig, plt.Figure):
             interactive = False
-        elif isinstance(fig, folium.Map):
+        elif _isinstance_lazy(fig, "folium", "Map"):
             interactive = True
         else:
             raise TypeError("fig must be a matplotlib.figure.Figure or folium.Map. Received: {}".format(type(fig)))
@@ -736,7 +1207,7 @@ class rpclass:
         :type ax:            matplotlib.axes.Axes, optional
         :param m:            Map.
         :type m:             folium.Map, optional
-        :param data_style:   Data type from guidelines.
+        :param data_style:   Data type from guidelines. If None, the data type is derived from the data attributes (see the data guidelines).
         :type data_style:    str, optional
         :param extent_style: Extent type from guidelines.
         :type extent_style:  str, optional
@@ -753,13 +1224,19 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
+        # Get data style from data attributes
+        if data_style is None:
+            data_style = self._get_data_style(data, "pcolormesh", interactive)
+
         # Get keyword arguments
-        kwargs = self._get_kwargs(data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "pcolormesh", data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot data
         if isinstance(data, xr.DataArray) and not interactive:
@@ -786,7 +1263,7 @@ class rpclass:
         :type ax:            matplotlib.axes.Axes, optional
         :param m:            Map.
         :type m:             folium.Map, optional
-        :param data_style:   Data type from guidelines.
+        :param data_style:   Data type from guidelines. If None, the data type is derived from the data attributes (see the data guidelines).
         :type data_style:    str, optional
         :param extent_style: Extent type from guidelines.
         :type extent_style:  str, optional
@@ -803,13 +1280,19 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
+        # Get data style from data attributes
+        if data_style is None:
+            data_style = self._get_data_style(data, "imshow", interactive)
+
         # Get keyword arguments
-        kwargs = self._get_kwargs(data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "imshow", data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot data
         if isinstance(data, xr.DataArray) and not interactive:
@@ -836,7 +1319,7 @@ class rpclass:
         :type ax:            matplotlib.axes.Axes, optional
         :param m:            Map.
         :type m:             folium.Map, optional
-        :param data_style:   Data type from guidelines.
+        :param data_style:   Data type from guidelines. If None, the data type is derived from the data attributes (see the data guidelines).
         :type data_style:    str, optional
         :param extent_style: Extent type from guidelines.
         :type extent_style:  str, optional
@@ -853,13 +1336,19 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
+        # Get data style from data attributes
+        if data_style is None:
+            data_style = self._get_data_style(data, "scatter", interactive)
+
         # Get keyword arguments
-        kwargs = self._get_kwargs(data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "scatter", data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot data
         if (isinstance(data, xr.DataArray) or isinstance(data, xr.Dataset)) and not interactive:
@@ -888,7 +1377,7 @@ class rpclass:
         :type ax:            matplotlib.axes.Axes,
         :param m:            Map.
         :type m:             folium.Map, optional
-        :param data_style:   Data type from guidelines.
+        :param data_style:   Data type from guidelines. If None, the data type is derived from the data attributes (see the data guidelines).
         :type data_style:    str, optional
         :param extent_style: Extent type from guidelines.
         :type extent_style:  str, optional
@@ -905,13 +1394,19 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
+        # Get data style from data attributes
+        if data_style is None:
+            data_style = self._get_data_style(data, "contourf", interactive)
+
         # Get keyword arguments
-        kwargs = self._get_kwargs(data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "contourf", data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot data
         if isinstance(data, xr.DataArray) and not interactive:
@@ -938,7 +1433,7 @@ class rpclass:
         :type ax:            matplotlib.axes.Axes or folium.Map, optional
         :param m:            Map.
         :type m:             folium.Map, optional
-        :param data_style:   Data type from guidelines.
+        :param data_style:   Data type from guidelines. If None, the data type is derived from the data attributes (see the data guidelines).
         :type data_style:    str, optional
         :param extent_style: Extent type from guidelines.
         :type extent_style:  str, optional
@@ -955,13 +1450,19 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
+        # Get data style from data attributes
+        if data_style is None:
+            data_style = self._get_data_style(data, "contour", interactive)
+
         # Get keyword arguments
-        kwargs = self._get_kwargs(data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "contour", data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot data
         if isinstance(data, xr.DataArray) and not interactive:
@@ -988,7 +1489,7 @@ class rpclass:
         :type ax:            matplotlib.axes.Axes, optional
         :param m:            Map.
         :type m:             folium.Map, optional
-        :param data_style:   Data type from guidelines.
+        :param data_style:   Data type from guidelines. If None, the data type is derived from the data attributes (see the data guidelines).
         :type data_style:    str, optional
         :param extent_style: Extent type from guidelines.
         :type extent_style:  str, optional
@@ -1005,13 +1506,19 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
+        # Get data style from data attributes
+        if data_style is None:
+            data_style = self._get_data_style(data, "quiver", interactive)
+
         # Get keyword arguments
-        kwargs = self._get_kwargs(data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "quiver", data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot data
         if isinstance(data, xr.Dataset) and not interactive:
@@ -1038,7 +1545,7 @@ class rpclass:
         :type ax:            matplotlib.axes.Axes, optional
         :param m:            Map.
         :type m:             folium.Map, optional
-        :param data_style:   Data type from guidelines.
+        :param data_style:   Data type from guidelines. If None, the data type is derived from the data attributes (see the data guidelines).
         :type data_style:    str, optional
         :param extent_style: Extent type from guidelines.
         :type extent_style:  str, optional
@@ -1055,13 +1562,19 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
+        # Get data style from data attributes
+        if data_style is None:
+            data_style = self._get_data_style(da, "streamplot", interactive)
+
         # Get keyword arguments
-        kwargs = self._get_kwargs(data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "streamplot", data_style=data_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot data
         if isinstance(da, xr.Dataset) and not interactive:
@@ -1101,13 +1614,13 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
         # Get keyword arguments
-        kwargs = self._get_kwargs(geom_style=geom_style, extent_style=extent_style, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs("grid", geom_style=geom_style, extent_style=extent_style, show_kwargs=show_kwargs, **kwargs)
 
         # Plot grid
         if (isinstance(data, xr.DataArray) or isinstance(data, xr.Dataset)) and not interactive:
@@ -1155,13 +1668,15 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
         # Get keyword arguments
-        kwargs = self._get_kwargs(geom_style=geom_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "geometries", geom_style=geom_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot geometries
         if isinstance(gdf, gpd.GeoDataFrame) and not interactive:
@@ -1201,7 +1716,7 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
@@ -1209,7 +1724,9 @@ class rpclass:
         # Get keyword arguments
         if crs is None:
             crs = self.guidelines["general"]["crs"]
-        kwargs = self._get_kwargs(map_style=map_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs(
+            "basemap", map_style=map_style, extent_style=extent_style, interactive=interactive, show_kwargs=show_kwargs, **kwargs
+        )
 
         # Plot basemap
         if (isinstance(crs, pyprojCRS) or isinstance(crs, rasterioCRS) or isinstance(crs, str)) and not interactive:
@@ -1245,13 +1762,13 @@ class rpclass:
         # Determine if plot is interactive
         if isinstance(ax, plt.Axes):
             interactive = False
-        elif isinstance(m, folium.Map):
+        elif _isinstance_lazy(m, "folium", "Map"):
             interactive = True
         elif interactive is None:
             interactive = False
 
         # Get keyword arguments
-        kwargs = self._get_kwargs(extent_style=extent_style, show_kwargs=show_kwargs, **kwargs)
+        kwargs = self._get_kwargs("cartopy", extent_style=extent_style, show_kwargs=show_kwargs, **kwargs)
 
         # Plot cartopy geometries
         if not interactive:
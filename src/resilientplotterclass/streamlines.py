@@ -0,0 +1,515 @@
+import collections
+import hashlib
+
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.patches import FancyArrowPatch
+
+# Define the number of cells of the occupancy grid per unit of density (as in matplotlib.pyplot.streamplot)
+MASK_CELLS = 30
+
+# Define the integration step size in cells of the occupancy grid
+STEP_SIZE = 0.5
+
+# Define the spacing of the start points of a wave in cells of the occupancy grid
+START_POINT_SPACING = 4
+
+# Define the integration directions
+INTEGRATION_DIRECTIONS = ["both", "forward", "backward"]
+
+# Define the maximum number of vector fields to cache streamlines for
+CACHE_SIZE = 16
+
+# Cached streamlines per fingerprint of the vector field and integration parameters
+_STREAMLINES_CACHE = collections.OrderedDict()
+
+
+def _get_mask_shape(density):
+    """Get the shape of the occupancy grid.
+
+    :param density: Density of the streamlines in x and y direction.
+    :type density:  float or tuple[float, float]
+    :return:        Number of cells of the occupancy grid in y and x direction.
+    :rtype:         tuple[int, int]
+    """
+
+    # Return the number of cells in y and x direction
+    density_x, density_y = np.broadcast_to(density, 2)
+    return max(int(MASK_CELLS * density_y), 1), max(int(MASK_CELLS * density_x), 1)
+
+
+def _get_fingerprint(*arrays, **parameters):
+    """Get a fingerprint of arrays and parameters.
+
+    :param arrays:     Arrays to fingerprint.
+    :type arrays:      numpy.ndarray
+    :param parameters: Parameters to fingerprint.
+    :type parameters:  dict
+    :return:           Fingerprint.
+    :rtype:            str
+    """
+
+    # Hash the shape, data type and values of the arrays
+    fingerprint = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        fingerprint.update("{}{}".format(array.shape, array.dtype.str).encode())
+        fingerprint.update(array.data)
+
+    # Hash the parameters
+    fingerprint.update(repr(sorted(parameters.items())).encode())
+
+    # Return the fingerprint
+    return fingerprint.hexdigest()
+
+
+def _get_periodic_distance(offset1, offset2, spacing):
+    """Get the distance between two offsets on a periodic lattice.
+
+    :param offset1: First offset in x and y direction.
+    :type offset1:  tuple[int, int]
+    :param offset2: Second offset in x and y direction.
+    :type offset2:  tuple[int, int]
+    :param spacing: Spacing of the lattice.
+    :type spacing:  int
+    :return:        Distance between the offsets.
+    :rtype:         float
+    """
+
+    # Get the distance in x and y direction (wrapping around the lattice)
+    di = abs(offset1[0] - offset2[0])
+    dj = abs(offset1[1] - offset2[1])
+
+    # Return the distance
+    return np.hypot(min(di, spacing - di), min(dj, spacing - dj))
+
+
+def get_start_points(xlim, ylim, density=1):
+    """Get start points of streamlines evenly distributed over an area.
+
+    The start points are placed at the centres of the cells of the occupancy grid and are grouped in waves. Each wave is a lattice of cells
+    ``START_POINT_SPACING`` cells apart, so streamlines that are integrated at once have room to grow, and is shifted as far as possible from
+    the previous waves, so the later waves fill the gaps between the streamlines of the earlier waves. The start points only depend on the area
+    and density, so they can be computed once and reused for all frames of an animation.
+
+    :param xlim:    x limits of the area.
+    :type xlim:     list[float]
+    :param ylim:    y limits of the area.
+    :type ylim:     list[float]
+    :param density: Density of the streamlines in x and y direction.
+    :type density:  float or tuple[float, float], optional
+    :return:        Waves of start points in data coordinates.
+    :rtype:         list[numpy.ndarray]
+    """
+
+    # Get the shape of the occupancy grid
+    mask_ny, mask_nx = _get_mask_shape(density)
+
+    # Get the offsets of the waves (each offset as far as possible from the previous offsets on the periodic lattice)
+    spacing = START_POINT_SPACING
+    candidates = [(oi, oj) for oj in range(spacing) for oi in range(spacing)]
+    offsets = [(spacing // 2, spacing // 2)]
+    candidates.remove(offsets[0])
+    while candidates:
+        distances = [min(_get_periodic_distance(candidate, offset, spacing) for offset in offsets) for candidate in candidates]
+        offsets.append(candidates.pop(int(np.argmax(distances))))
+
+    # Get the centres of the cells of the occupancy grid for each wave in data coordinates
+    start_points = []
+    for oi, oj in offsets:
+        j, i = np.mgrid[oj:mask_ny:spacing, oi:mask_nx:spacing]
+        x = min(xlim) + (i.ravel() + 0.5) / mask_nx * (max(xlim) - min(xlim))
+        y = min(ylim) + (j.ravel() + 0.5) / mask_ny * (max(ylim) - min(ylim))
+        start_points.append(np.column_stack([x, y]))
+
+    # Return the waves of start points
+    return start_points
+
+
+def _integrate_streamlines(x, y, u, v, density, start_points, minlength, maxlength, integration_direction):
+    """Integrate streamlines from all start points of a wave at once.
+
+    Streamlines are integrated in axes coordinates with a fixed step along the normalised vector field using the midpoint method. A streamline
+    ends when it leaves the field, reaches a NaN or zero vector, exceeds ``maxlength`` or enters a cell of the occupancy grid that is already
+    occupied by a streamline. Streamlines shorter than ``minlength`` are removed and release their cells.
+
+    :param x:                     x coordinates of the field in increasing order.
+    :type x:                      numpy.ndarray
+    :param y:                     y coordinates of the field in increasing order.
+    :type y:                      numpy.ndarray
+    :param u:                     x component of the field with shape (y, x).
+    :type u:                      numpy.ndarray
+    :param v:                     y component of the field with shape (y, x).
+    :type v:                      numpy.ndarray
+    :param density:               Density of the streamlines in x and y direction.
+    :type density:                float or tuple[float, float]
+    :param start_points:          Waves of start points in data coordinates.
+    :type start_points:           list[numpy.ndarray]
+    :param minlength:             Minimum length of a streamline in axes coordinates.
+    :type minlength:              float
+    :param maxlength:             Maximum length of a streamline in each direction in axes coordinates.
+    :type maxlength:              float
+    :param integration_direction: Integrate streamlines in ``"both"``, ``"forward"`` or ``"backward"`` direction.
+    :type integration_direction:  str
+    :return:                      Streamlines in data coordinates.
+    :rtype:                       list[numpy.ndarray]
+    """
+
+    # Get the coordinates and the field in axes coordinates
+    x_min, x_range = x[0], x[-1] - x[0]
+    y_min, y_range = y[0], y[-1] - y[0]
+    x_axes, y_axes = (x - x_min) / x_range, (y - y_min) / y_range
+    u_axes, v_axes = u / x_range, v / y_range
+    x_index, y_index = np.arange(x.size), np.arange(y.size)
+
+    # Function to get the normalised direction of the field at points in axes coordinates
+    def _get_direction(points):
+        # Get the fractional grid indices of the points
+        gx = np.interp(np.nan_to_num(points[:, 0]), x_axes, x_index)
+        gy = np.interp(np.nan_to_num(points[:, 1]), y_axes, y_index)
+        i = np.minimum(gx.astype(int), x.size - 2)
+        j = np.minimum(gy.astype(int), y.size - 2)
+        fx, fy = gx - i, gy - j
+
+        # Interpolate the field bilinearly
+        def _bilinear(a):
+            return (a[j, i] * (1 - fx) + a[j, i + 1] * fx) * (1 - fy) + (a[j + 1, i] * (1 - fx) + a[j + 1, i + 1] * fx) * fy
+
+        direction = np.column_stack([_bilinear(u_axes), _bilinear(v_axes)])
+
+        # Set the direction to NaN for points that are not finite
+        direction[~np.all(np.isfinite(points), axis=1)] = np.nan
+
+        # Normalise the direction (NaN for zero vectors)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return direction / np.hypot(direction[:, 0], direction[:, 1])[:, None]
+
+    # Get the occupancy grid and integration parameters
+    mask_ny, mask_nx = _get_mask_shape(density)
+    owner = np.zeros(mask_ny * mask_nx, dtype=np.int64)
+    step = STEP_SIZE / max(mask_nx, mask_ny)
+    max_steps = int(np.ceil(maxlength / step))
+    signs = {"both": [1, -1], "forward": [1], "backward": [-1]}[integration_direction]
+
+    # Function to get the occupancy grid cells of points in axes coordinates
+    def _get_cells(points):
+        i = np.clip((points[:, 0] * mask_nx).astype(int), 0, mask_nx - 1)
+        j = np.clip((points[:, 1] * mask_ny).astype(int), 0, mask_ny - 1)
+        return j * mask_nx + i
+
+    # Integrate the streamlines of each wave of start points
+    streamlines = []
+    next_id = 1
+    for points in start_points:
+        # Get the start points in axes coordinates within the field
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        points = np.column_stack([(points[:, 0] - x_min) / x_range, (points[:, 1] - y_min) / y_range])
+        points = points[np.all((points >= 0) & (points <= 1), axis=1)]
+
+        # Remove start points in occupied cells or in the same cell as a previous start point
+        cells = _get_cells(points)
+        _, first = np.unique(cells, return_index=True)
+        first = np.sort(first)
+        points, cells = points[first], cells[first]
+        free = owner[cells] == 0
+        points, cells = points[free], cells[free]
+        if points.shape[0] == 0:
+            continue
+
+        # Occupy the cells of the start points
+        line_ids = next_id + np.arange(points.shape[0])
+        next_id += points.shape[0]
+        owner[cells] = line_ids
+
+        # Get the particles (one per start point and integration direction)
+        particle_points = np.tile(points, (len(signs), 1))
+        particle_lines = np.tile(line_ids, len(signs))
+        particle_signs = np.repeat(signs, points.shape[0]).astype(float)
+        particle_cells = np.tile(cells, len(signs))
+        particle_lengths = np.zeros(particle_points.shape[0])
+        active = np.ones(particle_points.shape[0], dtype=bool)
+
+        # Record the start points of the particles
+        record_particles = [np.arange(particle_points.shape[0])]
+        record_points = [particle_points.copy()]
+
+        # Integrate all active particles at once
+        for _ in range(max_steps):
+            # Get the active particles
+            a = np.nonzero(active)[0]
+            if a.size == 0:
+                break
+
+            # Take a step with the midpoint method
+            p = particle_points[a]
+            s = particle_signs[a, None]
+            p_mid = p + 0.5 * step * s * _get_direction(p)
+            p_new = p + step * s * _get_direction(p_mid)
+
+            # Stop particles that leave the field, reach a NaN or zero vector or exceed the maximum length
+            ok = np.all(np.isfinite(p_new) & (p_new >= 0) & (p_new <= 1), axis=1)
+            ok &= particle_lengths[a] + step <= maxlength
+
+            # Stop particles that enter a cell occupied by a streamline
+            cells = _get_cells(np.nan_to_num(p_new))
+            moved = cells != particle_cells[a]
+            ok &= ~moved | (owner[cells] == 0)
+
+            # Stop particles that enter the same free cell as another particle in this step, except the first
+            claiming = np.nonzero(ok & moved)[0]
+            _, first = np.unique(cells[claiming], return_index=True)
+            losing = np.ones(claiming.size, dtype=bool)
+            losing[first] = False
+            ok[claiming[losing]] = False
+
+            # Occupy the entered cells and update the particles
+            entering = ok & moved
+            owner[cells[entering]] = particle_lines[a[entering]]
+            moving = a[ok]
+            particle_cells[moving] = cells[ok]
+            particle_points[moving] = p_new[ok]
+            particle_lengths[moving] += step
+            active[a[~ok]] = False
+
+            # Record the new points of the particles
+            record_particles.append(moving)
+            record_points.append(p_new[ok])
+
+        # Get the points of each particle in order of integration
+        record_particles = np.concatenate(record_particles)
+        record_points = np.concatenate(record_points)
+        order = np.argsort(record_particles, kind="stable")
+        counts = np.bincount(record_particles, minlength=particle_points.shape[0])
+        particle_tracks = np.split(record_points[order], np.cumsum(counts)[:-1])
+
+        # Combine the backward and forward particles into streamlines
+        n = points.shape[0]
+        short_ids = []
+        for k in range(n):
+            tracks = [particle_tracks[k + d * n] for d in range(len(signs))]
+            length = sum(particle_lengths[k + d * n] for d in range(len(signs)))
+            if integration_direction == "both":
+                track = np.concatenate([tracks[1][::-1], tracks[0][1:]])
+            elif integration_direction == "backward":
+                track = tracks[0][::-1]
+            else:
+                track = tracks[0]
+
+            # Remove short streamlines
+            if length < minlength or track.shape[0] < 2:
+                short_ids.append(line_ids[k])
+                continue
+
+            # Add the streamline in data coordinates
+            streamlines.append(np.column_stack([x_min + track[:, 0] * x_range, y_min + track[:, 1] * y_range]))
+
+        # Release the cells of short streamlines
+        if short_ids:
+            owner[np.isin(owner, short_ids)] = 0
+
+    # Return the streamlines
+    return streamlines
+
+
+def get_streamlines(x, y, u, v, density=1, start_points=None, minlength=0.1, maxlength=4.0, integration_direction="both"):
+    """Get streamlines of a vector field on a rectilinear grid.
+
+    Streamlines are integrated for all start points of a wave at once (see :func:`get_start_points`) and are cached per fingerprint of the
+    field and parameters, such that plotting the same field again (e.g. with another basemap) does not integrate the streamlines again. The
+    fingerprint is of the field as passed, so a field that is cropped to other limits or rescaled differently is integrated again.
+
+    :param x:                     x coordinates of the field.
+    :type x:                      numpy.ndarray
+    :param y:                     y coordinates of the field.
+    :type y:                      numpy.ndarray
+    :param u:                     x component of the field with shape (y, x).
+    :type u:                      numpy.ndarray
+    :param v:                     y component of the field with shape (y, x).
+    :type v:                      numpy.ndarray
+    :param density:               Density of the streamlines in x and y direction (as in :func:`matplotlib.pyplot.streamplot`).
+    :type density:                float or tuple[float, float], optional
+    :param start_points:          Start points in data coordinates, or a list of waves of start points. If ``None``, the start points of
+                                  :func:`get_start_points` for the extent of the field are used.
+    :type start_points:           numpy.ndarray or list[numpy.ndarray], optional
+    :param minlength:             Minimum length of a streamline in axes coordinates.
+    :type minlength:              float, optional
+    :param maxlength:             Maximum length of a streamline in each direction in axes coordinates.
+    :type maxlength:              float, optional
+    :param integration_direction: Integrate streamlines in ``"both"``, ``"forward"`` or ``"backward"`` direction.
+    :type integration_direction:  str, optional
+    :return:                      Streamlines in data coordinates.
+    :rtype:                       list[numpy.ndarray]
+    """
+
+    # Raise error for unknown integration directions
+    if integration_direction not in INTEGRATION_DIRECTIONS:
+        raise ValueError("integration_direction must be one of {}. Received: {}".format(INTEGRATION_DIRECTIONS, integration_direction))
+
+    # Get the coordinates and field as arrays
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    u, v = np.asarray(u, dtype=float), np.asarray(v, dtype=float)
+
+    # Raise error for fields that do not match the coordinates
+    if x.ndim != 1 or y.ndim != 1 or x.size < 2 or y.size < 2:
+        raise ValueError("x and y must be one-dimensional with at least two values. Received shapes: {} and {}".format(x.shape, y.shape))
+    if u.shape != (y.size, x.size) or v.shape != (y.size, x.size):
+        raise ValueError("u and v must have shape {}. Received: {} and {}".format((y.size, x.size), u.shape, v.shape))
+
+    # Sort the coordinates in increasing order
+    if x[0] > x[-1]:
+        x, u, v = x[::-1], u[:, ::-1], v[:, ::-1]
+    if y[0] > y[-1]:
+        y, u, v = y[::-1], u[::-1, :], v[::-1, :]
+
+    # Get the waves of start points
+    if start_points is None:
+        start_points = get_start_points([x[0], x[-1]], [y[0], y[-1]], density=density)
+    elif isinstance(start_points, np.ndarray):
+        start_points = [start_points]
+    start_points = [np.asarray(points, dtype=float).reshape(-1, 2) for points in start_points]
+
+    # Return the streamlines from the cache
+    key = _get_fingerprint(
+        x,
+        y,
+        u,
+        v,
+        *start_points,
+        density=tuple(np.broadcast_to(density, 2).tolist()),
+        waves=tuple(points.shape[0] for points in start_points),
+        minlength=minlength,
+        maxlength=maxlength,
+        integration_direction=integration_direction,
+    )
+    if key in _STREAMLINES_CACHE:
+        _STREAMLINES_CACHE.move_to_end(key)
+        return _STREAMLINES_CACHE[key]
+
+    # Integrate the streamlines
+    streamlines = _integrate_streamlines(x, y, u, v, density, start_points, minlength, maxlength, integration_direction)
+
+    # Add the streamlines to the cache and remove the least recently used streamlines
+    _STREAMLINES_CACHE[key] = streamlines
+    while len(_STREAMLINES_CACHE) > CACHE_SIZE:
+        _STREAMLINES_CACHE.popitem(last=False)
+
+    # Return the streamlines
+    return streamlines
+
+
+def streamplot(
+    ds,
+    ax,
+    x="x",
+    y="y",
+    u=None,
+    v=None,
+    density=1,
+    start_points=None,
+    minlength=0.1,
+    maxlength=4.0,
+    integration_direction="both",
+    color="C0",
+    linewidth=None,
+    arrowsize=1,
+    arrowstyle="-|>",
+    zorder=None,
+    hue=None,
+    add_guide=None,
+    **kwargs,
+):
+    """Plot streamlines of a Dataset.
+
+    Streamlines are obtained with :func:`get_streamlines` and plotted as a single :class:`matplotlib.collections.LineCollection` with an arrow
+    halfway each streamline, similar to :func:`matplotlib.pyplot.streamplot`.
+
+    :param ds:                    Data to plot.
+    :type ds:                     xarray.Dataset
+    :param ax:                    Axis.
+    :type ax:                     matplotlib.axes.Axes
+    :param x:                     Name of the x coordinate.
+    :type x:                      str, optional
+    :param y:                     Name of the y coordinate.
+    :type y:                      str, optional
+    :param u:                     Name of the x component of the field.
+    :type u:                      str
+    :param v:                     Name of the y component of the field.
+    :type v:                      str
+    :param density:               Density of the streamlines in x and y direction.
+    :type density:                float or tuple[float, float], optional
+    :param start_points:          Start points in data coordinates, or a list of waves of start points (see :func:`get_start_points`).
+    :type start_points:           numpy.ndarray or list[numpy.ndarray], optional
+    :param minlength:             Minimum length of a streamline in axes coordinates.
+    :type minlength:              float, optional
+    :param maxlength:             Maximum length of a streamline in each direction in axes coordinates.
+    :type maxlength:              float, optional
+    :param integration_direction: Integrate streamlines in ``"both"``, ``"forward"`` or ``"backward"`` direction.
+    :type integration_direction:  str, optional
+    :param color:                 Colour of the streamlines and arrows.
+    :type color:                  str, optional
+    :param linewidth:             Line width of the streamlines and arrows. If ``None``, the default line width is used.
+    :type linewidth:              float, optional
+    :param arrowsize:             Scaling factor of the arrow size.
+    :type arrowsize:              float, optional
+    :param arrowstyle:            Arrow style of the arrows.
+    :type arrowstyle:             str, optional
+    :param zorder:                Z order of the streamlines and arrows. If ``None``, the z order of lines is used.
+    :type zorder:                 float, optional
+    :param hue:                   Not supported, streamlines are plotted in a single colour.
+    :type hue:                    None, optional
+    :param add_guide:             Ignored, no guide is added for streamlines in a single colour.
+    :type add_guide:              bool, optional
+    :param kwargs:                Keyword arguments for :class:`matplotlib.collections.LineCollection`.
+    :type kwargs:                 dict, optional
+    :return:                      Plot.
+    :rtype:                       matplotlib.collections.LineCollection
+
+    :See also: `matplotlib.pyplot.streamplot <https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.streamplot.html>`_.
+    """
+
+    # Raise error for colouring streamlines by a variable
+    if hue is not None:
+        raise ValueError("hue is not supported for plotting streamlines with this engine. Received: {}".format(hue))
+
+    # Get the streamlines
+    da_u, da_v = ds[u].transpose(y, x), ds[v].transpose(y, x)
+    streamlines = get_streamlines(
+        ds[x].values,
+        ds[y].values,
+        da_u.values,
+        da_v.values,
+        density=density,
+        start_points=start_points,
+        minlength=minlength,
+        maxlength=maxlength,
+        integration_direction=integration_direction,
+    )
+
+    # Get the keyword arguments of the streamlines and arrows
+    zorder = Line2D.zorder if zorder is None else zorder
+    line_kwargs = {"color": color, "zorder": zorder, **kwargs}
+    arrow_kwargs = {"arrowstyle": arrowstyle, "mutation_scale": 10 * arrowsize, "color": color, "zorder": zorder}
+    if linewidth is not None:
+        line_kwargs["linewidth"] = linewidth
+        arrow_kwargs["linewidth"] = linewidth
+
+    # Plot the streamlines
+    p = LineCollection(streamlines, **line_kwargs)
+    p.sticky_edges.x[:] = [float(ds[x].min()), float(ds[x].max())]
+    p.sticky_edges.y[:] = [float(ds[y].min()), float(ds[y].max())]
+    ax.add_collection(p)
+
+    # Add an arrow halfway each streamline
+    for streamline in streamlines:
+        distance = np.cumsum(np.hypot(np.diff(streamline[:, 0]), np.diff(streamline[:, 1])))
+        index = np.searchsorted(distance, distance[-1] / 2)
+        arrow_tail = tuple(streamline[index])
+        arrow_head = tuple(np.mean(streamline[index : index + 2], axis=0))
+        ax.add_patch(FancyArrowPatch(arrow_tail, arrow_head, **arrow_kwargs))
+
+    # Update the limits of the axis
+    ax.autoscale_view()
+
+    # Return plot
+    return p
@@ -1,18 +1,425 @@
-import geopandas as gpd
 import matplotlib.pyplot as plt
 import numpy as np
-from shapely.geometry import LineString, MultiLineString
+import xarray as xr
+from matplotlib.collections import LineCollection
+from scipy.ndimage import gaussian_filter1d, uniform_filter1d
+from xarray.plot.utils import label_from_attrs
 
 import resilientplotterclass as rpc
-from resilientplotterclass.geometries import _plot_gdf
+
+# Define the minimum output resolution for automatic skipping (default resolution of rpclass.savefig)
+AUTO_SKIP_DPI = 300
+
+# Define the methods to skip values
+SKIP_METHODS = ["stride", "mean", "min", "max", "median"]
+
+# Define the methods to smooth values
+SMOOTH_METHODS = ["box", "gaussian"]
+
+# Define the keyword arguments supported by plotting regular grids directly with matplotlib
+IMSHOW_KWARGS = ["cmap", "vmin", "vmax", "center", "alpha", "zorder", "interpolation", "add_colorbar", "add_labels", "cbar_kwargs"]
+
+# Define the engines to plot streamlines
+STREAMPLOT_ENGINES = ["xarray", "numpy"]
+
+
+def _get_axis_size(ax):
+    """Get the size of an axis in inches.
+
+    :param ax: Axis.
+    :type ax:  matplotlib.axes.Axes
+    :return:   Width and height of the axis in inches.
+    :rtype:    tuple[float, float]
+    """
+
+    # Return the size of the axis in inches
+    bbox = ax.get_window_extent().transformed(ax.figure.dpi_scale_trans.inverted())
+    return bbox.width, bbox.height
+
+
+def _get_auto_skip(da, ax, dpi=AUTO_SKIP_DPI):
+    """Get the number of values to skip such that the data is not plotted at more values than output pixels.
+
+    The number of output pixels is determined from the size of the axis and the resolution of the figure or ``dpi``, whichever is higher.
+    The number of values to skip is the number of values per output pixel in the direction that fills the axis, such that the plot is
+    visually identical to a plot of all values with an equal aspect ratio.
+
+    :param da:  Data to plot.
+    :type da:   xarray.DataArray or xarray.Dataset
+    :param ax:  Axis.
+    :type ax:   matplotlib.axes.Axes
+    :param dpi: Minimum output resolution in dots per inch.
+    :type dpi:  float, optional
+    :return:    Number of values to skip.
+    :rtype:     int
+    """
+
+    # Get the size of the axis in output pixels
+    width, height = _get_axis_size(ax)
+    dpi = max(ax.figure.dpi, dpi)
+    width, height = max(width * dpi, 1), max(height * dpi, 1)
+
+    # Get the number of values per output pixel
+    values_per_pixel = max(da.sizes.get("x", 1) / width, da.sizes.get("y", 1) / height)
+
+    # Return the number of values to skip
+    return max(int(values_per_pixel), 1)
+
+
+def _get_density_skip(da, ax, density):
+    """Get the number of values to skip such that the data is not plotted at more values per inch than a density.
+
+    The number of values to skip is determined in the direction that fills the axis, such that the density is not exceeded in either
+    direction for a plot with an equal aspect ratio.
+
+    :param da:      Data to plot.
+    :type da:       xarray.DataArray or xarray.Dataset
+    :param ax:      Axis.
+    :type ax:       matplotlib.axes.Axes
+    :param density: Maximum number of values per inch of the axis.
+    :type density:  float
+    :return:        Number of values to skip.
+    :rtype:         int
+    """
+
+    # Get the maximum number of values in x and y direction
+    width, height = _get_axis_size(ax)
+    width, height = max(width * density, 1), max(height * density, 1)
+
+    # Return the number of values to skip
+    return max(int(np.ceil(max(da.sizes.get("x", 1) / width, da.sizes.get("y", 1) / height))), 1)
+
+
+def _crop(da, xlim=None, ylim=None, halo=1, step=1):
+    """Crop data to x and y limits.
+
+    The data within the limits is kept together with a halo of values on each side, such that cells, contours and smoothing windows that
+    extend into the limits are plotted correctly. The start index is aligned to ``step``, such that skipping values after cropping selects
+    the same values as for the full data. Dimensions without limits or without monotonic one-dimensional coordinates are not cropped.
+
+    :param da:   Data to crop.
+    :type da:    xarray.DataArray or xarray.Dataset
+    :param xlim: x limits in data coordinates.
+    :type xlim:  list[float], optional
+    :param ylim: y limits in data coordinates.
+    :type ylim:  list[float], optional
+    :param halo: Number of values to keep on each side of the limits.
+    :type halo:  int, optional
+    :param step: Step to align the start index to.
+    :type step:  int, optional
+    :return:     Cropped data.
+    :rtype:      xarray.DataArray or xarray.Dataset
+    """
+
+    # Get the index slices of the data within the limits
+    indexers = {}
+    for dim, lim in (("x", xlim), ("y", ylim)):
+        # Skip dimensions without limits or without one-dimensional coordinates
+        if lim is None or None in lim or dim not in da.dims or dim not in da.coords or da[dim].ndim != 1:
+            continue
+
+        # Get the coordinates in increasing order and skip non-monotonic coordinates
+        coords = da[dim].values
+        descending = coords.size > 1 and coords[0] > coords[-1]
+        if descending:
+            coords = coords[::-1]
+        if np.any(np.diff(coords) < 0):
+            continue
+
+        # Get the start and stop indices of the coordinates within the limits
+        start = int(np.searchsorted(coords, min(lim), side="left"))
+        stop = int(np.searchsorted(coords, max(lim), side="right"))
+        if descending:
+            start, stop = coords.size - stop, coords.size - start
+
+        # Add the halo and align the start index to the step
+        start = max(start - halo, 0)
+        start -= start % step
+        stop = min(stop + halo, coords.size)
+
+        # Add the index slice if the data is cropped
+        if start > 0 or stop < coords.size:
+            indexers[dim] = slice(start, stop)
+
+    # Return the cropped data
+    return da.isel(indexers) if indexers else da
+
+
+def _get_block_centres(coords, skip):
+    """Get the centres of blocks of n coordinates.
+
+    The coordinates of an incomplete block at the end are extrapolated with the last spacing, so regularly spaced coordinates give regularly
+    spaced block centres.
+
+    :param coords: Coordinates.
+    :type coords:  numpy.ndarray
+    :param skip:   Number of coordinates per block.
+    :type skip:    int
+    :return:       Centres of the blocks.
+    :rtype:        numpy.ndarray
+    """
+
+    # Extrapolate the coordinates of the incomplete block with the last spacing
+    n_blocks = -(-coords.size // skip)
+    step = coords[-1] - coords[-2] if coords.size > 1 else 0
+    coords = np.concatenate([coords, coords[-1] + step * np.arange(1, n_blocks * skip - coords.size + 1)])
+
+    # Return the centres of the blocks
+    return coords.reshape(n_blocks, skip).mean(axis=1)
+
+
+def _skip(da, skip=1, skip_method="stride"):
+    """Skip values of data in x and y direction.
+
+    :param da:          Data to skip values of.
+    :type da:           xarray.DataArray or xarray.Dataset
+    :param skip:        Keep every nth value or reduce blocks of n x n values in x and y direction.
+    :type skip:         int, optional
+    :param skip_method: Method to skip values: every nth value (``"stride"``) or the ``"mean"``, ``"min"``, ``"max"`` or ``"median"`` of
+                        blocks of n x n values, ignoring NaN values.
+    :type skip_method:  str, optional
+    :return:            Data with skipped values.
+    :rtype:             xarray.DataArray or xarray.Dataset
+    """
+
+    # Raise error for unknown skip methods
+    if skip_method not in SKIP_METHODS:
+        raise ValueError("skip_method must be one of {}. Received: {}".format(SKIP_METHODS, skip_method))
+
+    # Return the data if no values are skipped
+    if skip <= 1:
+        return da
+
+    # Keep every nth value
+    if skip_method == "stride":
+        return da.isel(x=slice(None, None, skip), y=slice(None, None, skip))
+
+    # Reduce blocks of n x n values ignoring NaN values (incomplete blocks at the end are padded with NaN values)
+    dims = [dim for dim in ["x", "y"] if dim in da.dims]
+    da_skipped = getattr(da.coarsen({dim: skip for dim in dims}, boundary="pad"), skip_method)()
+
+    # Set the coordinates to the centres of the blocks (the mean of padded coordinates is not the centre of incomplete blocks)
+    da_skipped = da_skipped.assign_coords({dim: (dim, _get_block_centres(da[dim].values, skip), da[dim].attrs) for dim in dims if dim in da.coords})
+
+    # Restore the data types of the minimum and maximum (padding with NaN values promotes integers to floats)
+    if skip_method in ["min", "max"]:
+        if isinstance(da, xr.Dataset):
+            da_skipped = da_skipped.assign({var: da_skipped[var].astype(da[var].dtype) for var in da.data_vars})
+        else:
+            da_skipped = da_skipped.astype(da.dtype)
+
+    # Return the data with skipped values
+    return da_skipped
+
+
+def _smooth_array(values, axes, smooth, smooth_method="box"):
+    """Smooth an array with a separable kernel along axes, ignoring NaN values.
+
+    :param values:        Values to smooth.
+    :type values:         numpy.ndarray
+    :param axes:          Axes to smooth along.
+    :type axes:           list[int]
+    :param smooth:        Window size of the kernel.
+    :type smooth:         int
+    :param smooth_method: Kernel to smooth with: box kernel (``"box"``) or Gaussian kernel with a standard deviation of a quarter of the
+                          window size (``"gaussian"``).
+    :type smooth_method:  str, optional
+    :return:              Smoothed values.
+    :rtype:               numpy.ndarray
+    """
+
+    # Function to filter an array along an axis
+    def _filter(array, axis):
+        if smooth_method == "box":
+            return uniform_filter1d(array, size=smooth, axis=axis, mode="constant")
+        elif smooth_method == "gaussian":
+            return gaussian_filter1d(array, sigma=smooth / 4, axis=axis, mode="constant", truncate=2.0)
+
+    # Get the valid values (floating point values keep their precision)
+    dtype = np.result_type(values.dtype, np.float32)
+    valid = np.isfinite(values)
+    all_valid = bool(valid.all())
+    values = values.astype(dtype, copy=False) if all_valid else np.where(valid, values, 0).astype(dtype, copy=False)
+
+    # Get the weights of the values (without NaN values, the weights are the product of the weights along each axis)
+    if all_valid:
+        weights = np.ones([1] * values.ndim, dtype=dtype)
+        for axis in axes:
+            shape = [1] * values.ndim
+            shape[axis] = values.shape[axis]
+            weights = weights * _filter(np.ones(shape, dtype=dtype), axis)
+    else:
+        weights = valid.astype(dtype)
+        for axis in axes:
+            weights = _filter(weights, axis)
+
+    # Filter the values along each axis
+    for axis in axes:
+        values = _filter(values, axis)
+
+    # Normalise the filtered values by the filtered weights and keep NaN values
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(values, weights, out=values)
+    if not all_valid:
+        values[~valid] = np.nan
+
+    # Return the smoothed values
+    return values
+
+
+def _smooth(da, smooth=1, smooth_method="box"):
+    """Smooth data in x and y direction, ignoring NaN values.
+
+    The data is smoothed with a separable kernel and normalised by the sum of the kernel weights of the valid values, so NaN values (e.g. dry
+    or land cells) do not spread to their neighbours and the data is smoothed up to the edges. Dask arrays are smoothed per chunk with a halo
+    of neighbouring values.
+
+    :param da:            Data to smooth.
+    :type da:             xarray.DataArray or xarray.Dataset
+    :param smooth:        Window size of the kernel in number of values.
+    :type smooth:         int, optional
+    :param smooth_method: Kernel to smooth with: box kernel (``"box"``) or Gaussian kernel with a standard deviation of a quarter of the
+                          window size (``"gaussian"``).
+    :type smooth_method:  str, optional
+    :return:              Smoothed data.
+    :rtype:               xarray.DataArray or xarray.Dataset
+    """
+
+    # Raise error for unknown smooth methods
+    if smooth_method not in SMOOTH_METHODS:
+        raise ValueError("smooth_method must be one of {}. Received: {}".format(SMOOTH_METHODS, smooth_method))
+
+    # Return the data if it is not smoothed
+    if smooth <= 1:
+        return da
+
+    # Smooth the data variables of a Dataset
+    if isinstance(da, xr.Dataset):
+        ds = da.copy()
+        for var in ds.data_vars:
+            ds[var] = _smooth(ds[var], smooth=smooth, smooth_method=smooth_method)
+        return ds
+
+    # Get the axes to smooth along
+    axes = [da.get_axis_num(dim) for dim in ["x", "y"] if dim in da.dims]
+    if not axes:
+        return da
+
+    # Smooth the values (dask arrays are smoothed per chunk with a halo of half the window size)
+    if hasattr(da.data, "map_overlap"):
+        depth = {axis: smooth // 2 + 1 for axis in axes}
+        dtype = np.result_type(da.dtype, np.float32)
+        values = da.data.map_overlap(_smooth_array, depth=depth, boundary="none", dtype=dtype, axes=axes, smooth=smooth, smooth_method=smooth_method)
+    else:
+        values = _smooth_array(da.values, axes=axes, smooth=smooth, smooth_method=smooth_method)
+
+    # Return the smoothed data
+    return da.copy(data=values)
+
+
+def _get_regular_extent(coords):
+    """Get the extent of the cells of regularly spaced coordinates.
+
+    :param coords: Coordinates of the cell centres.
+    :type coords:  numpy.ndarray
+    :return:       Start and end of the extent, or ``None`` if the coordinates are not regularly spaced.
+    :rtype:        tuple[float, float] or None
+    """
+
+    # Return None for coordinates that are not numeric or have less than two values
+    if coords.ndim != 1 or coords.size < 2 or not np.issubdtype(coords.dtype, np.number):
+        return None
+
+    # Return None for coordinates that are not regularly spaced
+    step = (coords[-1] - coords[0]) / (coords.size - 1)
+    if step == 0 or not np.allclose(np.diff(coords), step, rtol=1e-6, atol=0):
+        return None
+
+    # Return the extent of the cells
+    return float(coords[0] - step / 2), float(coords[-1] + step / 2)
+
+
+def _imshow_regular(da, ax, **kwargs):
+    """Plot a DataArray on a regular grid directly with :func:`matplotlib.axes.Axes.imshow`.
+
+    This skips the coordinate inference of :func:`xarray.plot.imshow` and :func:`xarray.plot.pcolormesh`, and plots a contiguous float32
+    array with an extent instead of a mesh of cells. Data that is not on a regular x and y grid, or keyword arguments that are not in
+    ``IMSHOW_KWARGS`` (e.g. ``levels`` or ``robust``), are not supported and return ``None`` so that the data can be plotted with xarray.
+
+    :param da:     Data to plot.
+    :type da:      xarray.DataArray
+    :param ax:     Axis.
+    :type ax:      matplotlib.axes.Axes
+    :param kwargs: Keyword arguments for :func:`xarray.plot.imshow`.
+    :type kwargs:  dict, optional
+    :return:       Plot, or ``None`` if the data or keyword arguments are not supported.
+    :rtype:        matplotlib.image.AxesImage or None
+    """
+
+    # Return None for unsupported keyword arguments or colour limits that xarray centres around zero
+    if any(key not in IMSHOW_KWARGS for key in kwargs):
+        return None
+    if kwargs.get("center") is not False and (kwargs.get("vmin") is None or kwargs.get("vmax") is None or kwargs.get("center") is not None):
+        return None
+
+    # Return None for data that is not two-dimensional, numeric data in x and y
+    if set(da.dims) != {"x", "y"} or not np.issubdtype(da.dtype, np.number) or np.issubdtype(da.dtype, np.complexfloating):
+        return None
+
+    # Return None for coordinates that are not regularly spaced
+    if "x" not in da.coords or "y" not in da.coords:
+        return None
+    x_extent = _get_regular_extent(da["x"].values)
+    y_extent = _get_regular_extent(da["y"].values)
+    if x_extent is None or y_extent is None:
+        return None
+
+    # Get the values as a contiguous float32 array with increasing x and y
+    values = da.transpose("y", "x").values
+    if x_extent[0] > x_extent[1]:
+        values, x_extent = values[:, ::-1], x_extent[::-1]
+    if y_extent[0] > y_extent[1]:
+        values, y_extent = values[::-1, :], y_extent[::-1]
+    values = np.ascontiguousarray(values, dtype=np.float32)
+
+    # Get the keyword arguments for matplotlib
+    add_colorbar = kwargs.pop("add_colorbar", True)
+    add_labels = kwargs.pop("add_labels", True)
+    cbar_kwargs = kwargs.pop("cbar_kwargs", None)
+    cbar_kwargs = {} if cbar_kwargs is None else dict(cbar_kwargs)
+    kwargs.pop("center", None)
+    kwargs.setdefault("interpolation", "nearest")
+    if not hasattr(ax, "projection"):
+        kwargs.setdefault("aspect", "auto")
+
+    # Plot values
+    p = ax.imshow(values, origin="lower", extent=[*x_extent, *y_extent], **kwargs)
+
+    # Add colorbar (extended if the data exceeds the colour limits)
+    if add_colorbar:
+        if add_labels:
+            cbar_kwargs.setdefault("label", label_from_attrs(da))
+        if kwargs.get("vmin") is not None or kwargs.get("vmax") is not None:
+            extend_min = kwargs.get("vmin") is not None and np.nanmin(values) < kwargs["vmin"]
+            extend_max = kwargs.get("vmax") is not None and np.nanmax(values) > kwargs["vmax"]
+            cbar_kwargs.setdefault("extend", ["neither", "min", "max", "both"][extend_min + 2 * extend_max])
+        if "cax" not in cbar_kwargs:
+            cbar_kwargs.setdefault("ax", ax)
+        ax.figure.colorbar(p, **cbar_kwargs)
+
+    # Return plot
+    return p
 
 
 def pcolormesh(
     da,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     skip=1,
+    skip_method="stride",
     smooth=1,
+    smooth_method="box",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -31,13 +438,19 @@ def pcolormesh(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
-    :param skip:               Plot every nth value in x and y direction.
-    :type skip:                int, optional
-    :param smooth:             Smooth data array with rolling mean in x and y direction.
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
+    :param skip:               Plot every nth value in x and y direction. If ``"auto"``, n is determined from the size of the axis in output pixels.
+    :type skip:                int or str, optional
+    :param skip_method:        Method to skip values: every nth value (``"stride"``) or the ``"mean"``, ``"min"``, ``"max"`` or ``"median"`` of blocks of n x n values.
+    :type skip_method:         str, optional
+    :param smooth:             Smooth data with a window of n values in x and y direction, ignoring NaN values.
     :type smooth:              int, optional
-    :param xlim:               x limits.
+    :param smooth_method:      Kernel to smooth data with: box kernel (``"box"``) or Gaussian kernel (``"gaussian"``).
+    :type smooth_method:       str, optional
+    :param xlim:               x limits in data coordinates. The data is cropped to the limits before plotting.
     :type xlim:                list[float], optional
-    :param ylim:               y limits.
+    :param ylim:               y limits in data coordinates. The data is cropped to the limits before plotting.
     :type ylim:                list[float], optional
     :param xlabel_kwargs:      Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:       dict, optional
@@ -51,10 +464,10 @@ def pcolormesh(
     :type grid_kwargs:         dict, optional
     :param append_axes_kwargs: Keyword arguments for :func:`mpl_toolkits.axes_grid1.axes_divider.AxesDivider.append_axes`.
     :type append_axes_kwargs:  dict, optional
-    :param kwargs:             Keyword arguments for :func:`xarray.plot.pcolormesh`.
+    :param kwargs:             Keyword arguments for :func:`xarray.plot.pcolormesh`. Data on a regular grid is plotted as an image.
     :type kwargs:              dict, optional
     :return:                   Plot.
-    :rtype:                    matplotlib.collections.QuadMesh
+    :rtype:                    matplotlib.collections.QuadMesh or matplotlib.image.AxesImage
 
     :See also: `matplotlib.axis.set_xlabel <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_xlabel.html>`_,
                `matplotlib.axis.set_ylabel <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_ylabel.html>`_,
@@ -65,37 +478,49 @@ def pcolormesh(
                `xarray.plot.pcolormesh <http://xarray.pydata.org/en/stable/generated/xarray.plot.pcolormesh.html>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
 
+    # Get the number of values to skip from the size of the axis
+    if skip == "auto":
+        skip = _get_auto_skip(_crop(da, xlim=xlim, ylim=ylim, halo=0), ax=ax)
+
+    # Crop the DataArray to the x and y limits (with a halo for skipping and smoothing)
+    da = _crop(da, xlim=xlim, ylim=ylim, halo=(smooth // 2 + 1) * skip, step=skip)
+
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=da, xy_unit=xy_unit)
 
-    # Rescale the DataArray
-    da = rpc.rescale.rescale(data=da, scale_factor=scale_factor)
+    # Rescale the DataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        da = rpc.rescale.rescale(data=da, scale_factor=scale_factor)
 
     # Skip DataArray values
-    if skip > 1:
-        da = da.isel(x=slice(None, None, skip), y=slice(None, None, skip))
+    da = _skip(da, skip=skip, skip_method=skip_method)
 
     # Smooth DataArray
-    if smooth > 1:
-        da = da.rolling(x=smooth, center=True).mean().rolling(y=smooth, center=True).mean()
+    da = _smooth(da, smooth=smooth, smooth_method=smooth_method)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" not in kwargs or kwargs["add_colorbar"]):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
-    # Plot DataArray
-    p = da.plot.pcolormesh(ax=ax, **kwargs)
+    # Plot DataArray (as image on regular grids, drawn above images like a mesh)
+    p = _imshow_regular(da, ax=ax, **{"zorder": 1, **kwargs})
+    if p is None:
+        p = da.plot.pcolormesh(ax=ax, **kwargs)
 
     # Format axis
     ax = rpc.axes.format(
         ax=ax,
         data=da,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -113,8 +538,11 @@ def imshow(
     da,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     skip=1,
+    skip_method="stride",
     smooth=1,
+    smooth_method="box",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -133,13 +561,19 @@ def imshow(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
-    :param skip:               Plot every nth value in x and y direction.
-    :type skip:                int, optional
-    :param smooth:             Smooth data array with rolling mean in x and y direction.
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
+    :param skip:               Plot every nth value in x and y direction. If ``"auto"``, n is determined from the size of the axis in output pixels.
+    :type skip:                int or str, optional
+    :param skip_method:        Method to skip values: every nth value (``"stride"``) or the ``"mean"``, ``"min"``, ``"max"`` or ``"median"`` of blocks of n x n values.
+    :type skip_method:         str, optional
+    :param smooth:             Smooth data with a window of n values in x and y direction, ignoring NaN values.
     :type smooth:              int, optional
-    :param xlim:               x limits.
+    :param smooth_method:      Kernel to smooth data with: box kernel (``"box"``) or Gaussian kernel (``"gaussian"``).
+    :type smooth_method:       str, optional
+    :param xlim:               x limits in data coordinates. The data is cropped to the limits before plotting.
     :type xlim:                list[float], optional
-    :param ylim:               y limits.
+    :param ylim:               y limits in data coordinates. The data is cropped to the limits before plotting.
     :type ylim:                list[float], optional
     :param xlabel_kwargs:      Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:       dict, optional
@@ -156,7 +590,7 @@ def imshow(
     :param kwargs:             Keyword arguments for :func:`xarray.plot.imshow`.
     :type kwargs:              dict, optional
     :return:                   Plot.
-    :rtype:                    matplotlib.collections.QuadMesh
+    :rtype:                    matplotlib.image.AxesImage
 
     :See also: `matplotlib.axis.set_xlabel <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_xlabel.html>`_,
                `matplotlib.axis.set_ylabel <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_ylabel.html>`_,
@@ -167,37 +601,49 @@ def imshow(
                `xarray.plot.imshow <http://xarray.pydata.org/en/stable/generated/xarray.plot.imshow.html>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
 
+    # Get the number of values to skip from the size of the axis
+    if skip == "auto":
+        skip = _get_auto_skip(_crop(da, xlim=xlim, ylim=ylim, halo=0), ax=ax)
+
+    # Crop the DataArray to the x and y limits (with a halo for skipping and smoothing)
+    da = _crop(da, xlim=xlim, ylim=ylim, halo=(smooth // 2 + 1) * skip, step=skip)
+
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=da, xy_unit=xy_unit)
 
-    # Rescale the DataArray
-    da = rpc.rescale.rescale(data=da, scale_factor=scale_factor)
+    # Rescale the DataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        da = rpc.rescale.rescale(data=da, scale_factor=scale_factor)
 
     # Skip DataArray values
-    if skip > 1:
-        da = da.isel(x=slice(None, None, skip), y=slice(None, None, skip))
+    da = _skip(da, skip=skip, skip_method=skip_method)
 
     # Smooth DataArray
-    if smooth > 1:
-        da = da.rolling(x=smooth, center=True).mean().rolling(y=smooth, center=True).mean()
+    da = _smooth(da, smooth=smooth, smooth_method=smooth_method)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" not in kwargs or kwargs["add_colorbar"]) and "rgb" not in kwargs:
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
-    # Plot DataArray
-    p = da.plot.imshow(ax=ax, **kwargs)
+    # Plot DataArray (directly with matplotlib on regular grids)
+    p = _imshow_regular(da, ax=ax, **kwargs)
+    if p is None:
+        p = da.plot.imshow(ax=ax, **kwargs)
 
     # Format axis
     ax = rpc.axes.format(
         ax=ax,
         data=da,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -215,8 +661,11 @@ def scatter(
     ds,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     skip=1,
+    skip_method="stride",
     smooth=1,
+    smooth_method="box",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -235,13 +684,19 @@ def scatter(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param skip:               Plot every nth value in x and y direction.
     :type skip:                int, optional
-    :param smooth:             Smooth data array with rolling mean in x and y direction.
+    :param skip_method:        Method to skip values: every nth value (``"stride"``) or the ``"mean"``, ``"min"``, ``"max"`` or ``"median"`` of blocks of n x n values.
+    :type skip_method:         str, optional
+    :param smooth:             Smooth data with a window of n values in x and y direction, ignoring NaN values.
     :type smooth:              int, optional
-    :param xlim:               x limits.
+    :param smooth_method:      Kernel to smooth data with: box kernel (``"box"``) or Gaussian kernel (``"gaussian"``).
+    :type smooth_method:       str, optional
+    :param xlim:               x limits in data coordinates. The data is cropped to the limits before plotting.
     :type xlim:                list[float], optional
-    :param ylim:               y limits.
+    :param ylim:               y limits in data coordinates. The data is cropped to the limits before plotting.
     :type ylim:                list[float], optional
     :param xlabel_kwargs:      Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:       dict, optional
@@ -269,27 +724,32 @@ def scatter(
                `xarray.plot.scatter <http://xarray.pydata.org/en/stable/generated/xarray.plot.scatter.html>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
 
+    # Crop the Dataset to the x and y limits (with a halo for skipping and smoothing)
+    ds = _crop(ds, xlim=xlim, ylim=ylim, halo=(smooth // 2 + 1) * skip, step=skip)
+
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=ds, xy_unit=xy_unit)
 
-    # Rescale the Dataset
-    ds = rpc.rescale.rescale(data=ds, scale_factor=scale_factor)
+    # Rescale the Dataset (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        ds = rpc.rescale.rescale(data=ds, scale_factor=scale_factor)
 
     # Skip Dataset values
-    if skip > 1:
-        ds = ds.isel(x=slice(None, None, skip), y=slice(None, None, skip))
+    ds = _skip(ds, skip=skip, skip_method=skip_method)
 
     # Smooth Dataset
-    if smooth > 1:
-        ds = ds.rolling(x=smooth, center=True).mean().rolling(y=smooth, center=True).mean()
+    ds = _smooth(ds, smooth=smooth, smooth_method=smooth_method)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" in kwargs and kwargs["add_colorbar"]) and ("hue" in kwargs and kwargs["hue"] is not None):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot Dataset
@@ -300,6 +760,7 @@ def scatter(
         ax=ax,
         data=ds,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -317,8 +778,11 @@ def contourf(
     da,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     skip=1,
+    skip_method="stride",
     smooth=1,
+    smooth_method="box",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -337,13 +801,19 @@ def contourf(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
-    :param skip:               Plot every nth value in x and y direction.
-    :type skip:                int, optional
-    :param smooth:             Smooth data array with rolling mean in x and y direction.
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
+    :param skip:               Plot every nth value in x and y direction. If ``"auto"``, n is determined from the size of the axis in output pixels.
+    :type skip:                int or str, optional
+    :param skip_method:        Method to skip values: every nth value (``"stride"``) or the ``"mean"``, ``"min"``, ``"max"`` or ``"median"`` of blocks of n x n values.
+    :type skip_method:         str, optional
+    :param smooth:             Smooth data with a window of n values in x and y direction, ignoring NaN values.
     :type smooth:              int, optional
-    :param xlim:               x limits.
+    :param smooth_method:      Kernel to smooth data with: box kernel (``"box"``) or Gaussian kernel (``"gaussian"``).
+    :type smooth_method:       str, optional
+    :param xlim:               x limits in data coordinates. The data is cropped to the limits before plotting.
     :type xlim:                list[float], optional
-    :param ylim:               y limits.
+    :param ylim:               y limits in data coordinates. The data is cropped to the limits before plotting.
     :type ylim:                list[float], optional
     :param xlabel_kwargs:      Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:       dict, optional
@@ -371,27 +841,36 @@ def contourf(
                `xarray.plot.contourf <http://xarray.pydata.org/en/stable/generated/xarray.plot.contourf.html>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
 
+    # Get the number of values to skip from the size of the axis
+    if skip == "auto":
+        skip = _get_auto_skip(_crop(da, xlim=xlim, ylim=ylim, halo=0), ax=ax)
+
+    # Crop the DataArray to the x and y limits (with a halo for skipping and smoothing)
+    da = _crop(da, xlim=xlim, ylim=ylim, halo=(smooth // 2 + 1) * skip, step=skip)
+
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=da, xy_unit=xy_unit)
 
-    # Rescale the DataArray
-    da = rpc.rescale.rescale(data=da, scale_factor=scale_factor)
+    # Rescale the DataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        da = rpc.rescale.rescale(data=da, scale_factor=scale_factor)
 
     # Skip DataArray values
-    if skip > 1:
-        da = da.isel(x=slice(None, None, skip), y=slice(None, None, skip))
+    da = _skip(da, skip=skip, skip_method=skip_method)
 
     # Smooth DataArray
-    if smooth > 1:
-        da = da.rolling(x=smooth, center=True).mean().rolling(y=smooth, center=True).mean()
+    da = _smooth(da, smooth=smooth, smooth_method=smooth_method)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" not in kwargs or kwargs["add_colorbar"]):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot DataArray
@@ -402,6 +881,7 @@ def contourf(
         ax=ax,
         data=da,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -419,8 +899,11 @@ def contour(
     da,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     skip=1,
+    skip_method="stride",
     smooth=1,
+    smooth_method="box",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -439,13 +922,19 @@ def contour(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
-    :param skip:               Plot every nth value in x and y direction.
-    :type skip:                int, optional
-    :param smooth:             Smooth data array with rolling mean in x and y direction.
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
+    :param skip:               Plot every nth value in x and y direction. If ``"auto"``, n is determined from the size of the axis in output pixels.
+    :type skip:                int or str, optional
+    :param skip_method:        Method to skip values: every nth value (``"stride"``) or the ``"mean"``, ``"min"``, ``"max"`` or ``"median"`` of blocks of n x n values.
+    :type skip_method:         str, optional
+    :param smooth:             Smooth data with a window of n values in x and y direction, ignoring NaN values.
     :type smooth:              int, optional
-    :param xlim:               x limits.
+    :param smooth_method:      Kernel to smooth data with: box kernel (``"box"``) or Gaussian kernel (``"gaussian"``).
+    :type smooth_method:       str, optional
+    :param xlim:               x limits in data coordinates. The data is cropped to the limits before plotting.
     :type xlim:                list[float], optional
-    :param ylim:               y limits.
+    :param ylim:               y limits in data coordinates. The data is cropped to the limits before plotting.
     :type ylim:                list[float], optional
     :param xlabel_kwargs:      Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:       dict, optional
@@ -473,27 +962,36 @@ def contour(
                `xarray.plot.contour <http://xarray.pydata.org/en/stable/generated/xarray.plot.contour.html>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
 
+    # Get the number of values to skip from the size of the axis
+    if skip == "auto":
+        skip = _get_auto_skip(_crop(da, xlim=xlim, ylim=ylim, halo=0), ax=ax)
+
+    # Crop the DataArray to the x and y limits (with a halo for skipping and smoothing)
+    da = _crop(da, xlim=xlim, ylim=ylim, halo=(smooth // 2 + 1) * skip, step=skip)
+
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=da, xy_unit=xy_unit)
 
-    # Rescale the DataArray
-    da = rpc.rescale.rescale(data=da, scale_factor=scale_factor)
+    # Rescale the DataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        da = rpc.rescale.rescale(data=da, scale_factor=scale_factor)
 
     # Skip DataArray values
-    if skip > 1:
-        da = da.isel(x=slice(None, None, skip), y=slice(None, None, skip))
+    da = _skip(da, skip=skip, skip_method=skip_method)
 
     # Smooth DataArray
-    if smooth > 1:
-        da = da.rolling(x=smooth, center=True).mean().rolling(y=smooth, center=True).mean()
+    da = _smooth(da, smooth=smooth, smooth_method=smooth_method)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" in kwargs and kwargs["add_colorbar"]):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot DataArray
@@ -504,6 +1002,7 @@ def contour(
         ax=ax,
         data=da,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -521,8 +1020,12 @@ def quiver(
     ds,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     skip=1,
+    skip_method="stride",
     smooth=1,
+    smooth_method="box",
+    density=None,
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -541,13 +1044,24 @@ def quiver(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param skip:               Plot every nth value in x and y direction.
     :type skip:                int, optional
-    :param smooth:             Smooth data array with rolling mean in x and y direction.
+    :param skip_method:        Method to skip values: every nth value (``"stride"``) or the ``"mean"``, ``"min"``, ``"max"`` or ``"median"`` of blocks of n x n values.
+    :type skip_method:         str, optional
+    :param smooth:             Smooth data with a window of n values in x and y direction, ignoring NaN values.
     :type smooth:              int, optional
-    :param xlim:               x limits.
+    :param smooth_method:      Kernel to smooth data with: box kernel (``"box"``) or Gaussian kernel (``"gaussian"``).
+    :type smooth_method:       str, optional
+    :param density:            Number of arrows per inch of the axis. If set, ``skip`` is determined from the density and the values are
+                               averaged in blocks of n x n values (unless another block reduction is set with ``skip_method``).
+    :type density:             float, optional
+    :param xlim:               x limits in data coordinates. The data is cropped to the limits before plotting and only arrows within the limits
+                               are plotted.
     :type xlim:                list[float], optional
-    :param ylim:               y limits.
+    :param ylim:               y limits in data coordinates. The data is cropped to the limits before plotting and only arrows within the limits
+                               are plotted.
     :type ylim:                list[float], optional
     :param xlabel_kwargs:      Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:       dict, optional
@@ -575,32 +1089,56 @@ def quiver(
                `xarray.plot.quiver <http://xarray.pydata.org/en/stable/generated/xarray.plot.quiver.html>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
 
+    # Select the variables to plot
+    ds = ds[[var for var in [kwargs.get("u"), kwargs.get("v"), kwargs.get("hue")] if var is not None and var in ds.data_vars]]
+
+    # Get the number of values to skip from the arrow density (averaging the values in blocks)
+    if density is not None:
+        skip = _get_density_skip(_crop(ds, xlim=xlim, ylim=ylim, halo=0), ax=ax, density=density)
+        skip_method = "mean" if skip_method == "stride" else skip_method
+
+    # Crop the Dataset to the x and y limits (with a halo for smoothing)
+    ds = _crop(ds, xlim=xlim, ylim=ylim, halo=smooth // 2 * skip, step=skip)
+
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=ds, xy_unit=xy_unit)
 
-    # Rescale the Dataset
-    ds = rpc.rescale.rescale(data=ds, scale_factor=scale_factor)
+    # Rescale the Dataset (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        ds = rpc.rescale.rescale(data=ds, scale_factor=scale_factor)
 
     # Skip Dataset values
-    if skip > 1:
-        ds = ds.isel(x=slice(None, None, skip), y=slice(None, None, skip))
+    ds = _skip(ds, skip=skip, skip_method=skip_method)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" in kwargs and kwargs["add_colorbar"]) and ("hue" in kwargs and kwargs["hue"] is not None):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Smooth Dataset
-    if smooth > 1:
-        ds = ds.rolling(x=smooth, center=True).mean().rolling(y=smooth, center=True).mean()
+    ds = _smooth(ds, smooth=smooth, smooth_method=smooth_method)
+
+    # Crop the Dataset to the x and y limits without halo, such that arrows outside the limits are not plotted
+    xlim_data, ylim_data = xlim, ylim
+    if rescale_mode == "data":
+        xlim_data = [lim * scale_factor for lim in xlim] if xlim is not None and None not in xlim else xlim
+        ylim_data = [lim * scale_factor for lim in ylim] if ylim is not None and None not in ylim else ylim
+    ds = _crop(ds, xlim=xlim_data, ylim=ylim_data, halo=0)
 
     # Transpose Dataset
     ds = ds.transpose("x", "y")
 
+    # Rescale the arrow scale of arrows in x and y units (in axis rescale mode, the x and y coordinates are not rescaled)
+    if rescale_mode == "axis" and kwargs.get("scale_units") == "xy" and kwargs.get("scale") is not None:
+        kwargs["scale"] = kwargs["scale"] * scale_factor
+
     # Plot Dataset
     p = ds.plot.quiver(ax=ax, **kwargs)
 
@@ -609,6 +1147,7 @@ def quiver(
         ax=ax,
         data=ds,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -626,8 +1165,12 @@ def streamplot(
     ds,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     skip=1,
+    skip_method="stride",
     smooth=1,
+    smooth_method="box",
+    engine="xarray",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -646,13 +1189,23 @@ def streamplot(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param skip:               Plot every nth value in x and y direction.
     :type skip:                int, optional
-    :param smooth:             Smooth data array with rolling mean in x and y direction.
+    :param skip_method:        Method to skip values: every nth value (``"stride"``) or the ``"mean"``, ``"min"``, ``"max"`` or ``"median"`` of blocks of n x n values.
+    :type skip_method:         str, optional
+    :param smooth:             Smooth data with a window of n values in x and y direction, ignoring NaN values.
     :type smooth:              int, optional
-    :param xlim:               x limits.
+    :param smooth_method:      Kernel to smooth data with: box kernel (``"box"``) or Gaussian kernel (``"gaussian"``).
+    :type smooth_method:       str, optional
+    :param engine:             Engine to plot streamlines: :func:`xarray.plot.streamplot` (``"xarray"``) or :func:`resilientplotterclass.streamlines.streamplot`
+                               (``"numpy"``), which integrates all streamlines at once, reuses start points between frames and caches the streamlines of the
+                               plotted (cropped and rescaled) field.
+    :type engine:              str, optional
+    :param xlim:               x limits in data coordinates. The data is cropped to the limits before plotting.
     :type xlim:                list[float], optional
-    :param ylim:               y limits.
+    :param ylim:               y limits in data coordinates. The data is cropped to the limits before plotting.
     :type ylim:                list[float], optional
     :param xlabel_kwargs:      Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:       dict, optional
@@ -666,10 +1219,11 @@ def streamplot(
     :type grid_kwargs:         dict, optional
     :param append_axes_kwargs: Keyword arguments for :func:`mpl_toolkits.axes_grid1.axes_divider.AxesDivider.append_axes`.
     :type append_axes_kwargs:  dict, optional
-    :param kwargs:             Keyword arguments for :func:`xarray.plot.streamplot`.
+    :param kwargs:             Keyword arguments for :func:`xarray.plot.streamplot` or :func:`resilientplotterclass.streamlines.streamplot`. Start
+                               points (``start_points``) are in data coordinates and are rescaled with the data.
     :type kwargs:              dict, optional
     :return:                   Plot.
-    :rtype:                    matplotlib.collections.QuadMesh
+    :rtype:                    matplotlib.collections.LineCollection
 
     :See also: `matplotlib.axis.set_xlabel <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_xlabel.html>`_,
                `matplotlib.axis.set_ylabel <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_ylabel.html>`_,
@@ -680,40 +1234,61 @@ def streamplot(
                `xarray.plot.streamplot <http://xarray.pydata.org/en/stable/generated/xarray.plot.streamplot.html>`_.
     """
 
+    # Raise error for unknown engines
+    if engine not in STREAMPLOT_ENGINES:
+        raise ValueError("engine must be one of {}. Received: {}".format(STREAMPLOT_ENGINES, engine))
+
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
 
+    # Select the variables to plot
+    ds = ds[[var for var in [kwargs.get("u"), kwargs.get("v"), kwargs.get("hue")] if var is not None and var in ds.data_vars]]
+
+    # Crop the Dataset to the x and y limits (with a halo for skipping and smoothing)
+    ds = _crop(ds, xlim=xlim, ylim=ylim, halo=(smooth // 2 + 1) * skip, step=skip)
+
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=ds, xy_unit=xy_unit)
 
-    # Rescale the DataArray
-    ds = rpc.rescale.rescale(data=ds, scale_factor=scale_factor)
+    # Rescale the Dataset and the start points of the streamlines (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        ds = rpc.rescale.rescale(data=ds, scale_factor=scale_factor)
+        if isinstance(kwargs.get("start_points"), np.ndarray):
+            kwargs["start_points"] = kwargs["start_points"] * scale_factor
+        elif kwargs.get("start_points") is not None:
+            kwargs["start_points"] = [np.asarray(points, dtype=float) * scale_factor for points in kwargs["start_points"]]
 
     # Skip DataArray values
-    if skip > 1:
-        ds = ds.isel(x=slice(None, None, skip), y=slice(None, None, skip))
+    ds = _skip(ds, skip=skip, skip_method=skip_method)
 
     # Smooth DataArray
-    if smooth > 1:
-        ds = ds.rolling(x=smooth, center=True).mean().rolling(y=smooth, center=True).mean()
+    ds = _smooth(ds, smooth=smooth, smooth_method=smooth_method)
 
-    # Sort such that y is srictly increasing
-    ds = ds.sortby("y")
+    # Sort such that y is srictly increasing (the numpy engine sorts the coordinates itself)
+    if engine == "xarray":
+        ds = ds.sortby("y")
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" in kwargs and kwargs["add_colorbar"]) and ("hue" in kwargs and kwargs["hue"] is not None):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot Dataset
-    p = ds.plot.streamplot(ax=ax, **kwargs)
+    if engine == "xarray":
+        p = ds.plot.streamplot(ax=ax, **kwargs)
+    elif engine == "numpy":
+        p = rpc.streamlines.streamplot(ds, ax=ax, **kwargs)
 
     # Format axis
     ax = rpc.axes.format(
         ax=ax,
         data=ds,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -731,6 +1306,7 @@ def grid(
     da,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     skip=1,
     smooth=1,
     xlim=None,
@@ -751,13 +1327,15 @@ def grid(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param skip:               Plot every nth value in x and y direction.
     :type skip:                int, optional
     :param smooth:             Smooth data array with rolling mean in x and y direction.
     :type smooth:              int, optional
-    :param xlim:               x limits.
+    :param xlim:               x limits in data coordinates. The grid lines are clipped to the limits.
     :type xlim:                list[float], optional
-    :param ylim:               y limits.
+    :param ylim:               y limits in data coordinates. The grid lines are clipped to the limits.
     :type ylim:                list[float], optional
     :param xlabel_kwargs:      Keyword arguments for :func:`matplotlib.axis.set_xlabel`.
     :type xlabel_kwargs:       dict, optional
@@ -771,19 +1349,23 @@ def grid(
     :type grid_kwargs:         dict, optional
     :param append_axes_kwargs: Keyword arguments for :func:`mpl_toolkits.axes_grid1.axes_divider.AxesDivider.append_axes`.
     :type append_axes_kwargs:  dict, optional
-    :param kwargs:             Keyword arguments for `xarray.plot.grid`.
+    :param kwargs:             Keyword arguments for :class:`matplotlib.collections.LineCollection`.
     :type kwargs:              dict, optional
-    :return:                   Plot.
-    :rtype:                    matplotlib.collections.QuadMesh
+    :return:                   Axis.
+    :rtype:                    matplotlib.axes.Axes
 
     :See also: `matplotlib.axis.set_xlabel <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_xlabel.html>`_,
                `matplotlib.axis.set_ylabel <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_ylabel.html>`_,
                `matplotlib.axis.set_title <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html>`_,
                `matplotlib.axis.set_aspect <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_aspect.html>`_,
                `matplotlib.axis.grid <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.grid.html>`_,
-               `mpl_toolkits.axes_grid1.axes_divider.AxesDivider.append_axes <https://matplotlib.org/stable/api/_as_gen/mpl_toolkits.axes_grid1.axes_divider.AxesDivider.html#mpl_toolkits.axes_grid1.axes_divider.AxesDivider.append_axes>`_
+               `mpl_toolkits.axes_grid1.axes_divider.AxesDivider.append_axes <https://matplotlib.org/stable/api/_as_gen/mpl_toolkits.axes_grid1.axes_divider.AxesDivider.html#mpl_toolkits.axes_grid1.axes_divider.AxesDivider.append_axes>`_,
+               `matplotlib.collections.LineCollection <https://matplotlib.org/stable/api/collections_api.html#matplotlib.collections.LineCollection>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
@@ -791,9 +1373,10 @@ def grid(
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=da, xy_unit=xy_unit)
 
-    # Get bounds and resolution
+    # Get bounds and resolution (as for increasing x and decreasing y coordinates)
     xmin, ymin, xmax, ymax = da.rio.bounds()
     xres, yres = da.rio.resolution()
+    xres, yres = abs(xres), -abs(yres)
 
     # Shift bounds to center of pixel
     xmin = xmin + xres / 2
@@ -816,23 +1399,45 @@ def grid(
     ymin = ymax - np.ceil((ymax - ymin) / yres) * yres
     xmax = xmin + np.floor((xmax - xmin) / xres) * xres
 
-    # Get grid GeoDataFrame
-    lines = []
-    lines.extend(LineString([(xmin, y), (xmax, y)]) for y in np.arange(ymax, ymin + yres, yres))
-    lines.extend(LineString([(x, ymin), (x, ymax)]) for x in np.arange(xmin, xmax + xres, xres))
-    gdf_grid = gpd.GeoDataFrame(geometry=[MultiLineString(lines)], crs=da.rio.crs)
-
-    # Rescale the GeoDataFrame
-    gdf_grid = rpc.rescale.rescale(data=gdf_grid, scale_factor=scale_factor)
-
-    # Plot GeoDataFrame
-    ax = _plot_gdf(gdf_grid, ax=ax, **kwargs)
+    # Get the x and y coordinates of the grid lines
+    ys = np.arange(ymax, ymin + yres, yres)
+    xs = np.arange(xmin, xmax + xres, xres)
+
+    # Clip the grid lines to the x and y limits
+    x_start, x_end = xmin, xmax
+    y_start, y_end = ymin, ymax
+    if xlim is not None:
+        x_start, x_end = max(x_start, min(xlim)), min(x_end, max(xlim))
+        xs = xs[(xs >= x_start) & (xs <= x_end)]
+    if ylim is not None:
+        y_start, y_end = max(y_start, min(ylim)), min(y_end, max(ylim))
+        ys = ys[(ys >= y_start) & (ys <= y_end)]
+
+    # Draw no grid lines if the x and y limits do not overlap the grid (reversed segments would be drawn outside the grid)
+    if x_start >= x_end or y_start >= y_end:
+        xs, ys = xs[:0], ys[:0]
+
+    # Get the segments of the horizontal and vertical grid lines
+    segments = np.empty((ys.size + xs.size, 2, 2))
+    segments[: ys.size, :, 0] = [x_start, x_end]
+    segments[: ys.size, :, 1] = ys[:, None]
+    segments[ys.size :, :, 0] = xs[:, None]
+    segments[ys.size :, :, 1] = [y_start, y_end]
+
+    # Rescale the segments (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        segments *= scale_factor
+
+    # Plot the grid lines as a single LineCollection
+    ax.add_collection(LineCollection(segments, **kwargs))
+    ax.autoscale_view()
 
     # Format axis
     ax = rpc.axes.format(
-        data=gdf_grid,
+        data=da,
         ax=ax,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
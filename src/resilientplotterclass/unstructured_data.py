@@ -7,6 +7,7 @@ def pcolormesh(
     uda,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -25,6 +26,8 @@ def pcolormesh(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param xlim:               x limits.
     :type xlim:                list[float], optional
     :param ylim:               y limits.
@@ -55,6 +58,9 @@ def pcolormesh(
                `xugrid.plot.pcolormesh <https://deltares.github.io/xugrid/api/xugrid.plot.pcolormesh.html#xugrid.plot.pcolormesh>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
@@ -62,12 +68,13 @@ def pcolormesh(
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=uda, xy_unit=xy_unit)
 
-    # Rescale UgridudataArray
-    uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
+    # Rescale UgridudataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" not in kwargs or kwargs["add_colorbar"]):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot UgridDataArray
@@ -78,6 +85,7 @@ def pcolormesh(
         ax=ax,
         data=uda,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -95,6 +103,7 @@ def imshow(
     uda,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -113,6 +122,8 @@ def imshow(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param xlim:               x limits.
     :type xlim:                list[float], optional
     :param ylim:               y limits.
@@ -143,18 +154,22 @@ def imshow(
                `xugrid.plot.imshow <https://deltares.github.io/xugrid/api/xugrid.plot.imshow.html#xugrid.plot.imshow>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=uda, xy_unit=xy_unit)
 
-    # Rescale UgridudataArray
-    uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
+    # Rescale UgridudataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" not in kwargs or kwargs["add_colorbar"]):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot UgridDataArray
@@ -165,6 +180,7 @@ def imshow(
         ax=ax,
         data=uda,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -182,6 +198,7 @@ def scatter(
     uda,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -200,6 +217,8 @@ def scatter(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param xlim:               x limits.
     :type xlim:                list[float], optional
     :param ylim:               y limits.
@@ -230,6 +249,9 @@ def scatter(
                `xugrid.plot.scatter <https://deltares.github.io/xugrid/api/xugrid.plot.scatter.html#xugrid.plot.scatter>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
@@ -237,12 +259,13 @@ def scatter(
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=uda, xy_unit=xy_unit)
 
-    # Rescale UgridudataArray
-    uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
+    # Rescale UgridudataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and (("add_colorbar" in kwargs and kwargs["add_colorbar"]) or ("hue" in kwargs and kwargs["hue"] is not None)):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot UgridDataArray
@@ -253,6 +276,7 @@ def scatter(
         ax=ax,
         data=uda,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -270,6 +294,7 @@ def contourf(
     uda,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -288,6 +313,8 @@ def contourf(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param xlim:               x limits.
     :type xlim:                list[float], optional
     :param ylim:               y limits.
@@ -318,6 +345,9 @@ def contourf(
                `xugrid.plot.contourf <https://deltares.github.io/xugrid/api/xugrid.plot.contourf.html#xugrid.plot.contourf>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
@@ -325,12 +355,13 @@ def contourf(
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=uda, xy_unit=xy_unit)
 
-    # Rescale UgridudataArray
-    uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
+    # Rescale UgridudataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" not in kwargs or kwargs["add_colorbar"]):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot UgridDataArray
@@ -341,6 +372,7 @@ def contourf(
         ax=ax,
         data=uda,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -358,6 +390,7 @@ def contour(
     uda,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -376,6 +409,8 @@ def contour(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param xlim:               x limits.
     :type xlim:                list[float], optional
     :param ylim:               y limits.
@@ -406,6 +441,9 @@ def contour(
                `xugrid.plot.contour <https://deltares.github.io/xugrid/api/xugrid.plot.contour.html#xugrid.plot.contour>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
@@ -413,12 +451,13 @@ def contour(
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=uda, xy_unit=xy_unit)
 
-    # Rescale UgridudataArray
-    uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
+    # Rescale UgridudataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and ("add_colorbar" in kwargs and kwargs["add_colorbar"]):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot UgridDataArray
@@ -429,6 +468,7 @@ def contour(
         ax=ax,
         data=uda,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -446,6 +486,7 @@ def quiver(
     uds,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -464,6 +505,8 @@ def quiver(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param xlim:               x limits.
     :type xlim:                list[float], optional
     :param ylim:               y limits.
@@ -494,6 +537,9 @@ def quiver(
                `xarray.plot.quiver <http://xarray.pydata.org/en/stable/generated/xarray.plot.quiver.html>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
@@ -501,14 +547,19 @@ def quiver(
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=uds, xy_unit=xy_unit)
 
-    # Rescale UgridDataSet
-    uds = rpc.rescale.rescale(data=uds, scale_factor=scale_factor)
+    # Rescale UgridDataSet (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        uds = rpc.rescale.rescale(data=uds, scale_factor=scale_factor)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and (("add_colorbar" in kwargs and kwargs["add_colorbar"]) or ("hue" in kwargs and kwargs["hue"] is not None)):
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
+    # Rescale the arrow scale of arrows in x and y units (in axis rescale mode, the x and y coordinates are not rescaled)
+    if rescale_mode == "axis" and kwargs.get("scale_units") == "xy" and kwargs.get("scale") is not None:
+        kwargs["scale"] = kwargs["scale"] * scale_factor
+
     # Plot UgridDataSet
     p = uds.plot.quiver(ax=ax, **kwargs)
 
@@ -517,6 +568,7 @@ def quiver(
         ax=ax,
         data=uds,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
@@ -534,6 +586,7 @@ def grid(
     uda,
     ax=None,
     xy_unit=None,
+    rescale_mode="data",
     xlim=None,
     ylim=None,
     xlabel_kwargs=None,
@@ -552,6 +605,8 @@ def grid(
     :type ax:                  matplotlib.axes.Axes, optional
     :param xy_unit:            Unit to rescale the x and y dimensions to. If ``None``, the unit is determined automatically based on the input data.
     :type xy_unit:             str, optional
+    :param rescale_mode:       Rescale the x and y coordinates of the data (``"data"``) or the tick labels of the axis (``"axis"``).
+    :type rescale_mode:        str, optional
     :param xlim:               x limits.
     :type xlim:                list[float], optional
     :param ylim:               y limits.
@@ -582,6 +637,9 @@ def grid(
                `xugrid.Ugrid2d.plot <https://deltares.github.io/xugrid/api/xugrid.Ugrid2d.html#xugrid.Ugrid2d.plot>`_.
     """
 
+    # Register the colormap on first use
+    rpc.colormaps.register_colormap(kwargs.get("cmap"))
+
     # Initialise axis
     if ax is None:
         _, ax = plt.subplots(1, 1, figsize=(10, 10))
@@ -589,12 +647,13 @@ def grid(
     # Get the rescale parameters
     scale_factor, _, _ = rpc.rescale.get_rescale_parameters(data=uda, xy_unit=xy_unit)
 
-    # Rescale UgridudataArray
-    uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
+    # Rescale UgridudataArray (in axis rescale mode, the tick labels are rescaled instead)
+    if rescale_mode == "data":
+        uda = rpc.rescale.rescale(data=uda, scale_factor=scale_factor)
 
     # Append colorbar axis
     if append_axes_kwargs is not None and "add_colorbar" in kwargs and kwargs["add_colorbar"]:
-        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else kwargs["cbar_kwargs"]
+        kwargs["cbar_kwargs"] = {} if "cbar_kwargs" not in kwargs or kwargs["cbar_kwargs"] is None else dict(kwargs["cbar_kwargs"])
         kwargs["cbar_kwargs"]["cax"] = rpc.axes.append_cbar_axis(ax=ax, append_axes_kwargs=append_axes_kwargs)
 
     # Plot UgridDataArray
@@ -605,6 +664,7 @@ def grid(
         ax=ax,
         data=uda,
         xy_unit=xy_unit,
+        rescale_mode=rescale_mode,
         xlim=xlim,
         ylim=ylim,
         xlabel_kwargs=xlabel_kwargs,
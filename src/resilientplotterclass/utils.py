@@ -3,20 +3,83 @@ from shapely.geometry import Point
 import xarray as xr
 import xugrid as xu
 import numpy as np
-from resilientplotterclass.rescale import _rescale_xugrid
+
+# Define the default grid names and dimension names per topology dimension
+DEFAULT_GRID_NAMES = {1: 'network1d', 2: 'mesh2d'}
+DEFAULT_GRID_DIMENSIONS = {1: {'node_dimension': 'network1d_nNodes', 'edge_dimension': 'network1d_nEdges'},
+                           2: {'node_dimension': 'mesh2d_nNodes', 'edge_dimension': 'mesh2d_nEdges', 'face_dimension': 'mesh2d_nFaces'}}
+
+# Function to get the dimension names of a grid
+def _get_grid_dimensions(grid):
+    """Get the dimension names of a grid.
+
+    The names are read from the grid attributes (e.g. ``grid.node_dimension``) instead of ``grid.dimensions``, which derives the edges of 2D
+    grids that do not have them yet.
+
+    :param grid: Grid to get the dimension names of.
+    :type grid:  xugrid.Ugrid1d or xugrid.Ugrid2d
+    :return:     Dimension names, keyed by dimension attribute (e.g. ``'node_dimension'``).
+    :rtype:      dict[str, str]
+    """
+
+    # Return the dimension names
+    return {attribute: getattr(grid, attribute) for attribute in DEFAULT_GRID_DIMENSIONS[grid.topology_dimension]}
+
+# Function to get a grid with the default names
+def _get_renamed_grid(grid):
+    """Get a grid with the default grid name and dimension names.
+
+    :param grid: Grid to rename.
+    :type grid:  xugrid.Ugrid1d or xugrid.Ugrid2d
+    :return:     Renamed grid, or the grid itself if it already has the default names.
+    :rtype:      xugrid.Ugrid1d or xugrid.Ugrid2d
+    """
+
+    # Get the default grid name and dimension names
+    name = DEFAULT_GRID_NAMES[grid.topology_dimension]
+    dims = DEFAULT_GRID_DIMENSIONS[grid.topology_dimension]
+
+    # Reuse the grid if it already has the default names
+    if grid.name == name and _get_grid_dimensions(grid) == dims:
+        return grid
+
+    # Return the renamed grid
+    return grid.rename(name)
 
 # Function to rename the dimensions of the data
 def _rename_xugrid(uda):
     """Rename dimensions of data.
 
+    The dimensions of the grids are renamed to the default names (e.g. ``mesh2d_nFaces``). Grids that already have the default names are
+    reused, so renaming data that is already standardised does not copy the data or rebuild the grids.
+
     :param uda: Data to rename dimensions.
     :type uda:  xugrid.UgridDataArray or xugrid.UgridDataset
     :return:    Standardised data.
     :rtype:     xugrid.UgridDataArray or xugrid.UgridDataset
     """
 
-    # Use rescale xugrid function with scale factor 1
-    uda_renamed = _rescale_xugrid(uda, 1)
+    # Get the renamed grids
+    grids = [_get_renamed_grid(grid) for grid in uda.grids]
+
+    # Get the dimensions to rename
+    dims = {}
+    for grid, grid_renamed in zip(uda.grids, grids):
+        dims_renamed = _get_grid_dimensions(grid_renamed)
+        dims.update({dim: dims_renamed[attribute] for attribute, dim in _get_grid_dimensions(grid).items() if dim != dims_renamed[attribute]})
+
+    # Return the data if the dimensions do not have to be renamed
+    if not dims and all(grid is grid_renamed for grid, grid_renamed in zip(uda.grids, grids)):
+        return uda
+
+    # Rename the dimensions of the data
+    obj = uda.obj.rename({dim: dim_renamed for dim, dim_renamed in dims.items() if dim in uda.obj.dims})
+
+    # Assign the renamed grids to the data
+    if isinstance(uda, xu.UgridDataArray):
+        uda_renamed = xu.UgridDataArray(obj=obj, grid=grids[0])
+    elif isinstance(uda, xu.UgridDataset):
+        uda_renamed = xu.UgridDataset(obj=obj, grids=grids)
 
     # Return the standardised data
     return uda_renamed
@@ -61,6 +124,9 @@ def reproject_xugrid(uda, crs, **kwargs):
         # Return the reprojected grid
         return grid
 
+    # Rename the dimensions of the data before the grids are rebuilt with the default names
+    uda = _rename_xugrid(uda)
+
     # Assign the coordinate arrays to the data
     if isinstance(uda, xu.UgridDataArray):
         grid = _reproject_grid(uda.grid, crs, **kwargs)
@@ -69,9 +135,6 @@ def reproject_xugrid(uda, crs, **kwargs):
         grids = [_reproject_grid(grid, crs, **kwargs) for grid in uda.grids]
         uda_rescaled = xu.UgridDataset(obj=xr.Dataset(uda), grids=grids)
 
-    # Rename the dimensions of the data
-    uda_rescaled = _rename_xugrid(uda_rescaled)
-    
     # Set the coordinate reference system
     uda_rescaled.grid.set_crs(crs)
 
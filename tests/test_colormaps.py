@@ -0,0 +1,64 @@
+import threading
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import rioxarray  # noqa: F401
+import xarray as xr
+
+import resilientplotterclass as rpc
+
+
+def _unregister(base_name):
+    """Unregister a custom colormap and clear the registration cache.
+
+    :param base_name: Name of the custom colormap.
+    :type base_name:  str
+    """
+
+    # Unregister colormaps and clear the registration cache
+    for suffix in ["", "_r", "_contour", "_contour_r"]:
+        if base_name + suffix in mpl.colormaps:
+            mpl.colormaps.unregister(base_name + suffix)
+    rpc.colormaps._register_colormap.cache_clear()
+
+
+def test_register_colormap_ignores_non_names():
+    assert rpc.colormaps.register_colormap(None) is False
+    assert rpc.colormaps.register_colormap(plt.get_cmap("viridis")) is False
+    assert rpc.colormaps.register_colormap("viridis") is False
+
+
+def test_register_colormap_concurrently():
+    _unregister("bedforms")
+    errors = []
+    barrier = threading.Barrier(8)
+
+    def register():
+        barrier.wait()
+        try:
+            rpc.colormaps.register_colormap("bedforms_r")
+        except ValueError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=register) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert "bedforms_contour_r" in mpl.colormaps
+
+
+def test_plotting_functions_register_colormap():
+    _unregister("morphology")
+    da = xr.DataArray(np.arange(12.0).reshape(3, 4), coords={"x": np.arange(4.0), "y": np.arange(3.0)}, dims=("y", "x")).rio.write_crs("EPSG:32631")
+    _, ax = plt.subplots()
+    p = rpc.structured_data.pcolormesh(da, ax=ax, cmap="morphology_contour", add_colorbar=False)
+    assert p.get_cmap().name == "morphology_contour"
+    plt.close("all")
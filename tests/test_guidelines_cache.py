@@ -0,0 +1,60 @@
+import json
+import os
+import pickle
+import sys
+
+import pytest
+
+import resilientplotterclass as rpc
+
+# Get the rpclass module (the package attribute rpclass is the class)
+rpclass_module = sys.modules["resilientplotterclass.rpclass"]
+
+
+@pytest.fixture
+def file_path_project(tmp_path):
+    # Write project guidelines file
+    file_path_project = str(tmp_path / "project.json")
+    with open(file_path_project, "w") as f:
+        json.dump({"general": {"xy_unit": "km"}}, f)
+    return file_path_project
+
+
+def _get_file_path_cache(file_path_project):
+    # Get file path to the guidelines cache file of the default and project guidelines
+    file_path_default = os.path.join(os.path.dirname(rpclass_module.__file__), "guidelines", "default.json")
+    return rpc.rpclass()._get_file_path_guidelines_cache([file_path_default, file_path_project])
+
+
+class _Removed:
+    pass
+
+
+@pytest.mark.parametrize(
+    "guidelines_cache",
+    [
+        pytest.param(b"not a pickle", id="corrupt"),
+        pytest.param(pickle.dumps(({}, {})), id="wrong-structure"),
+        pytest.param(pickle.dumps(_Removed()).replace(b"_Removed", b"_Missing"), id="missing-class"),
+        pytest.param(pickle.dumps(_Removed()).replace(b"test_guidelines_cache", b"missing_module_xyzabc"), id="missing-module"),
+    ],
+)
+def test_stale_cache_is_recomputed(file_path_project, guidelines_cache):
+    # Write a stale cache file
+    file_path_cache = _get_file_path_cache(file_path_project)
+    os.makedirs(os.path.dirname(file_path_cache), exist_ok=True)
+    with open(file_path_cache, "wb") as f:
+        f.write(guidelines_cache)
+
+    # Read guidelines, recomputing the stale cache
+    rpclass = rpc.rpclass(project_guidelines=file_path_project)
+    assert rpclass.guidelines["general"]["xy_unit"] == "km"
+
+    # Check the cache file is replaced by valid guidelines
+    assert rpclass._read_guidelines_cache(file_path_cache) is not None
+
+
+def test_cache_key_includes_cache_version(file_path_project, monkeypatch):
+    file_path_cache = _get_file_path_cache(file_path_project)
+    monkeypatch.setattr(rpclass_module, "_GUIDELINES_CACHE_VERSION", rpclass_module._GUIDELINES_CACHE_VERSION + 1)
+    assert _get_file_path_cache(file_path_project) != file_path_cache
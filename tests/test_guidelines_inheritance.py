@@ -0,0 +1,53 @@
+import IPython.display
+import pytest
+
+import resilientplotterclass as rpc
+
+
+def _get_guidelines(project_guidelines):
+    # Get guidelines of the default and project guidelines
+    return rpc.rpclass(project_guidelines=project_guidelines).guidelines
+
+
+def test_default_inheritance():
+    bathymetry = _get_guidelines(None)["data_style"]["bathymetry"]
+    assert "extends" not in bathymetry["imshow"]
+    assert bathymetry["imshow"] == bathymetry["pcolormesh"]
+
+
+def test_project_guideline_does_not_change_default_extending_guidelines():
+    default_bathymetry = _get_guidelines(None)["data_style"]["bathymetry"]
+    bathymetry = _get_guidelines({"data_style": {"bathymetry": {"pcolormesh": {"cmap": "viridis"}}}})["data_style"]["bathymetry"]
+    assert bathymetry["pcolormesh"]["cmap"] == "viridis"
+    assert bathymetry["imshow"] == default_bathymetry["imshow"]
+    assert bathymetry["contourf"] == default_bathymetry["contourf"]
+
+
+def test_project_guideline_extends_project_guideline():
+    project_guidelines = {
+        "data_style": {"bathymetry": {"pcolormesh": {"cmap": "viridis"}, "imshow": {"extends": "pcolormesh", "alpha": 0.5}}},
+    }
+    bathymetry = _get_guidelines(project_guidelines)["data_style"]["bathymetry"]
+    assert bathymetry["imshow"] == {**bathymetry["pcolormesh"], "alpha": 0.5}
+
+
+def test_cyclic_inheritance():
+    project_guidelines = {"data_style": {"bathymetry": {"pcolormesh": {"extends": "imshow"}, "imshow": {"extends": "pcolormesh"}}}}
+    with pytest.raises(ValueError, match="Cyclic inheritance"):
+        _get_guidelines(project_guidelines)
+
+
+def test_guideline_origins_resolve_inheritance(monkeypatch):
+    monkeypatch.setattr(IPython.display, "display", lambda *args, **kwargs: None)
+    project_guidelines = {
+        "data_style": {
+            "bathymetry": {"pcolormesh": {"cmap": "viridis"}, "imshow": {"extends": "pcolormesh", "alpha": 0.5}},
+            "bedforms": {"pcolormesh": {"cmap": "viridis"}},
+        },
+    }
+    rpclass = rpc.rpclass(project_guidelines=project_guidelines)
+    rpclass.show_guideline_origins()
+    df_guideline_origins = rpclass._df_guideline_origins
+    assert df_guideline_origins.loc[("data_style", "bathymetry"), "pcolormesh"] == "D+P"
+    assert df_guideline_origins.loc[("data_style", "bathymetry"), "imshow"] == "P"
+    assert df_guideline_origins.loc[("data_style", "bedforms"), "imshow"] == "D"
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+import textwrap
+
+# Define the heavy packages that must not be imported by importing the package
+LAZY_PACKAGES = ["folium", "ipyleaflet", "cv2", "contextily"]
+
+
+def _run(code):
+    """Run code in a fresh Python interpreter.
+
+    :param code: Code to run.
+    :type code:  str
+    :return:     Standard output.
+    :rtype:      str
+    """
+
+    # Run code and return standard output
+    result = subprocess.run([sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def test_import_does_not_import_heavy_packages():
+    stdout = _run(
+        """
+        import sys
+        import resilientplotterclass
+        print(",".join(package for package in {} if package in sys.modules))
+        """.format(LAZY_PACKAGES)
+    )
+    assert stdout.strip() == ""
+
+
+def test_lazy_attributes():
+    stdout = _run(
+        """
+        import resilientplotterclass
+        print(type(resilientplotterclass.rpc).__name__)
+        print(resilientplotterclass.rpc is resilientplotterclass.rpc)
+        print(resilientplotterclass.rescale.__name__)
+        print("rescale" in dir(resilientplotterclass))
+        """
+    )
+    assert stdout.split() == ["rpclass", "True", "resilientplotterclass.rescale", "True"]
+
+
+def test_unknown_attribute():
+    stdout = _run(
+        """
+        import resilientplotterclass
+        try:
+            resilientplotterclass.unknown
+        except AttributeError:
+            print("AttributeError")
+        """
+    )
+    assert stdout.strip() == "AttributeError"
@@ -0,0 +1,33 @@
+import geopandas as gpd
+import numpy as np
+import shapely
+
+import resilientplotterclass as rpc
+
+
+def test_rescale_GeoDataFrame_preserves_has_z():
+    gdf = gpd.GeoDataFrame(
+        {"value": [1, 2, 3, 4]},
+        geometry=[shapely.Point(1000, 2000), shapely.LineString([(0, 0, 5), (1000, 1000, 6)]), None, shapely.Polygon([(0, 0), (1000, 0), (0, 1000)])],
+        crs="EPSG:32631",
+    )
+    gdf_rescaled = rpc.rescale._rescale_GeoDataFrame(gdf, 0.001)
+
+    # Check dimensions, coordinates and attributes
+    np.testing.assert_array_equal(gdf_rescaled.has_z.values, gdf.has_z.values)
+    assert gdf_rescaled.geometry.iloc[0].equals(shapely.Point(1, 2))
+    np.testing.assert_allclose(shapely.get_coordinates(gdf_rescaled.geometry.iloc[1], include_z=True), [[0, 0, 5], [1, 1, 6]])
+    assert gdf_rescaled.geometry.iloc[2] is None
+    assert gdf_rescaled.crs == gdf.crs
+    assert gdf_rescaled["value"].tolist() == [1, 2, 3, 4]
+
+    # Check the original geometries are not modified
+    assert gdf.geometry.iloc[0].equals(shapely.Point(1000, 2000))
+
+
+def test_rescale_GeoDataFrame_matches_scale():
+    gdf = gpd.GeoDataFrame(geometry=[shapely.Point(1000, 2000), shapely.Polygon([(0, 0), (1000, 0), (0, 1000)])], crs="EPSG:32631")
+    gdf_rescaled = rpc.rescale._rescale_GeoDataFrame(gdf, 0.001)
+    gdf_scaled = gdf.geometry.scale(xfact=0.001, yfact=0.001, origin=(0, 0))
+    assert all(gdf_rescaled.geometry.geom_equals_exact(gdf_scaled, tolerance=1e-12))
+    assert not gdf_rescaled.has_z.any()
@@ -0,0 +1,170 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+import rioxarray  # noqa: F401
+import xarray as xr
+
+import resilientplotterclass as rpc
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Clear the streamlines cache before and after each test
+    rpc.streamlines._STREAMLINES_CACHE.clear()
+    yield
+    rpc.streamlines._STREAMLINES_CACHE.clear()
+
+
+@pytest.fixture
+def count_integrations(monkeypatch):
+    # Count the number of integrations
+    counter = {"n": 0}
+    integrate_streamlines = rpc.streamlines._integrate_streamlines
+
+    def _integrate_streamlines(*args, **kwargs):
+        counter["n"] += 1
+        return integrate_streamlines(*args, **kwargs)
+
+    monkeypatch.setattr(rpc.streamlines, "_integrate_streamlines", _integrate_streamlines)
+    return counter
+
+
+def _get_field(field, n=101):
+    # Get a uniform or rotating field on a square domain from -1 to 1
+    x = y = np.linspace(-1, 1, n)
+    X, Y = np.meshgrid(x, y)
+    if field == "uniform":
+        return x, y, np.ones_like(X), np.zeros_like(Y)
+    return x, y, -Y, X
+
+
+def test_get_start_points():
+    start_points = rpc.streamlines.get_start_points([0, 30], [0, 60], density=1)
+    points = np.concatenate(start_points)
+
+    # Check the waves cover each cell of the occupancy grid exactly once
+    assert len(start_points) == rpc.streamlines.START_POINT_SPACING**2
+    assert points.shape == (30 * 30, 2)
+    assert np.unique(points, axis=0).shape[0] == points.shape[0]
+    np.testing.assert_allclose(np.unique(points[:, 0]), 0.5 + np.arange(30))
+    np.testing.assert_allclose(np.unique(points[:, 1]), 1 + 2 * np.arange(30))
+
+    # Check the start points of each wave are the spacing apart
+    spacing = rpc.streamlines.START_POINT_SPACING
+    np.testing.assert_allclose(np.diff(np.unique(start_points[0][:, 0])), spacing)
+    np.testing.assert_allclose(np.diff(np.unique(start_points[0][:, 1])), 2 * spacing)
+
+
+def test_get_start_points_density():
+    points = np.concatenate(rpc.streamlines.get_start_points([0, 1], [0, 1], density=(2, 0.5)))
+    assert points.shape == (60 * 15, 2)
+
+
+@pytest.mark.parametrize("integration_direction", ["both", "forward", "backward"])
+def test_uniform_flow(integration_direction):
+    x, y, u, v = _get_field("uniform")
+    start_points = np.array([[-0.5, -0.5], [0.0, 0.25], [0.5, 0.5]])
+    streamlines = rpc.streamlines.get_streamlines(x, y, u, v, start_points=start_points, integration_direction=integration_direction)
+
+    # Check the streamlines are horizontal, in the direction of the flow and start or end at the start points
+    assert len(streamlines) == 3
+    for streamline, start_point in zip(streamlines, start_points):
+        np.testing.assert_allclose(streamline[:, 1], start_point[1])
+        assert np.all(np.diff(streamline[:, 0]) > 0)
+        if integration_direction == "forward":
+            np.testing.assert_allclose(streamline[0], start_point)
+            assert streamline[-1, 0] > 0.95
+        elif integration_direction == "backward":
+            np.testing.assert_allclose(streamline[-1], start_point)
+            assert streamline[0, 0] < -0.95
+        else:
+            assert streamline[0, 0] < -0.95 and streamline[-1, 0] > 0.95
+
+
+def test_rotating_flow():
+    x, y, u, v = _get_field("rotation")
+    start_points = np.array([[0.25, 0.0], [0.5, 0.0], [0.75, 0.0]])
+    streamlines = rpc.streamlines.get_streamlines(x, y, u, v, start_points=start_points, integration_direction="forward", maxlength=2.0)
+
+    # Check the streamlines are circles (the midpoint method keeps the radius within the step size)
+    assert len(streamlines) == 3
+    for streamline, start_point in zip(streamlines, start_points):
+        radius = np.hypot(streamline[:, 0], streamline[:, 1])
+        np.testing.assert_allclose(radius, start_point[0], atol=0.01)
+
+        # Check the streamlines rotate counterclockwise
+        angle = np.unwrap(np.arctan2(streamline[:, 1], streamline[:, 0]))
+        assert np.all(np.diff(angle) > 0)
+
+
+def test_streamlines_stop_at_nan():
+    x, y, u, v = _get_field("uniform")
+    u[:, (x > 0.2) & (x < 0.4)] = np.nan
+    streamlines = rpc.streamlines.get_streamlines(x, y, u, v, start_points=np.array([[-0.5, 0.0]]), integration_direction="forward")
+    assert len(streamlines) == 1
+    assert 0.1 < streamlines[0][-1, 0] <= 0.2 + 1e-9
+
+
+def test_streamlines_do_not_cross():
+    x, y, u, v = _get_field("rotation")
+    streamlines = rpc.streamlines.get_streamlines(x, y, u, v, density=1)
+    cells = [set(map(tuple, np.floor((streamline + 1) / 2 * 30).astype(int).clip(0, 29))) for streamline in streamlines]
+    assert len(streamlines) > 10
+    for k, cells_k in enumerate(cells):
+        for cells_l in cells[k + 1 :]:
+            assert len(cells_k & cells_l) <= 2
+
+
+def test_invalid_arguments():
+    x, y, u, v = _get_field("uniform")
+    with pytest.raises(ValueError, match="integration_direction"):
+        rpc.streamlines.get_streamlines(x, y, u, v, integration_direction="sideways")
+    with pytest.raises(ValueError, match="u and v must have shape"):
+        rpc.streamlines.get_streamlines(x, y, u.T[:-1], v)
+
+
+def test_cache_hit_and_miss(count_integrations):
+    x, y, u, v = _get_field("rotation")
+    streamlines = rpc.streamlines.get_streamlines(x, y, u, v)
+    assert count_integrations["n"] == 1
+
+    # Check the same field and parameters are a cache hit (also for copies of the field)
+    assert rpc.streamlines.get_streamlines(x.copy(), y.copy(), u.copy(), v.copy()) is streamlines
+    assert count_integrations["n"] == 1
+
+    # Check another field, parameters or start points are a cache miss
+    rpc.streamlines.get_streamlines(x, y, u * -1, v * -1)
+    rpc.streamlines.get_streamlines(x, y, u, v, density=2)
+    rpc.streamlines.get_streamlines(x, y, u, v, integration_direction="forward")
+    rpc.streamlines.get_streamlines(x, y, u, v, start_points=np.array([[0.5, 0.0]]))
+    assert count_integrations["n"] == 5
+
+
+def test_cache_size(count_integrations, monkeypatch):
+    monkeypatch.setattr(rpc.streamlines, "CACHE_SIZE", 2)
+    x, y, u, v = _get_field("rotation", n=11)
+    for factor in [1, 2, 3, 1]:
+        rpc.streamlines.get_streamlines(x, y, u * factor, v)
+    assert len(rpc.streamlines._STREAMLINES_CACHE) == 2
+    assert count_integrations["n"] == 4
+
+
+def test_structured_streamplot_rescales_start_points():
+    x = np.linspace(0, 10000, 51)
+    y = np.linspace(0, 8000, 41)
+    ds = xr.Dataset(
+        {"u": (("y", "x"), np.ones((y.size, x.size))), "v": (("y", "x"), np.zeros((y.size, x.size)))}, coords={"x": x, "y": y}
+    ).rio.write_crs("EPSG:32631")
+    start_points = np.array([[2000.0, 4000.0], [5000.0, 6000.0]])
+    _, ax = plt.subplots()
+    p = rpc.structured_data.streamplot(ds, ax=ax, x="x", y="y", u="u", v="v", engine="numpy", start_points=start_points, xy_unit="km")
+    plt.close("all")
+
+    # Check the streamlines start at the rescaled start points
+    segments = p.get_segments()
+    assert len(segments) == 2
+    np.testing.assert_allclose(sorted(segment[0, 1] for segment in segments), [4, 6])
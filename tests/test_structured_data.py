@@ -0,0 +1,96 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+import rioxarray  # noqa: F401
+import xarray as xr
+from matplotlib.collections import LineCollection
+
+import resilientplotterclass as rpc
+
+
+def _get_da(ny=7, nx=10, dtype=float):
+    # Get data on a regular grid with decreasing y coordinates
+    x = 100.0 + 10.0 * np.arange(nx)
+    y = 500.0 - 5.0 * np.arange(ny)
+    return xr.DataArray(np.arange(ny * nx).reshape(ny, nx).astype(dtype), coords={"x": x, "y": y}, dims=("y", "x"), attrs={"units": "m"})
+
+
+@pytest.mark.parametrize("skip_method", ["mean", "min", "max", "median"])
+def test_skip_non_divisible_shape_gives_regular_block_centres(skip_method):
+    da = _get_da()
+    da_skipped = rpc.structured_data._skip(da, skip=3, skip_method=skip_method)
+
+    # Check the block centres are regularly spaced, including the incomplete blocks at the end
+    assert da_skipped.sizes == {"y": 3, "x": 4}
+    np.testing.assert_allclose(da_skipped["x"], 110.0 + 30.0 * np.arange(4))
+    np.testing.assert_allclose(da_skipped["y"], 495.0 - 15.0 * np.arange(3))
+    assert rpc.structured_data._get_regular_extent(da_skipped["x"].values) == (95.0, 215.0)
+    assert rpc.structured_data._get_regular_extent(da_skipped["y"].values) == (502.5, 457.5)
+    assert da_skipped.attrs == da.attrs
+
+
+def test_skip_values_of_incomplete_blocks():
+    da = _get_da()
+    np.testing.assert_array_equal(rpc.structured_data._skip(da, skip=3, skip_method="max").values[-1], [62, 65, 68, 69])
+    np.testing.assert_array_equal(rpc.structured_data._skip(da, skip=3, skip_method="min").values[-1], [60, 63, 66, 69])
+
+
+@pytest.mark.parametrize("skip_method", ["min", "max"])
+def test_skip_preserves_integer_dtype(skip_method):
+    da = _get_da(dtype=np.int32)
+    assert rpc.structured_data._skip(da, skip=3, skip_method=skip_method).dtype == np.int32
+    ds = xr.Dataset({"a": da, "b": da.astype(np.float32)})
+    ds_skipped = rpc.structured_data._skip(ds, skip=3, skip_method=skip_method)
+    assert ds_skipped["a"].dtype == np.int32
+    assert ds_skipped["b"].dtype == np.float32
+
+
+@pytest.mark.parametrize(
+    "xlim, ylim, n_segments",
+    [
+        pytest.param(None, None, 8 + 11, id="full"),
+        pytest.param([120, 160], [480, 495], 3 + 4, id="overlap"),
+        pytest.param([1000, 2000], None, 0, id="x-outside"),
+        pytest.param(None, [0, 100], 0, id="y-outside"),
+    ],
+)
+def test_grid_clips_to_limits(xlim, ylim, n_segments):
+    da = _get_da().rio.write_crs("EPSG:32631")
+    _, ax = plt.subplots()
+    rpc.structured_data.grid(da, ax=ax, rescale_mode="axis", xlim=xlim, ylim=ylim)
+    segments = np.concatenate([collection.get_segments() for collection in ax.collections if isinstance(collection, LineCollection)] or [[]])
+    plt.close("all")
+
+    # Check the number of grid lines and that all grid lines are within the grid and the limits
+    assert len(segments) == n_segments
+    if n_segments:
+        segments = np.asarray(segments)
+        assert segments[:, :, 0].min() >= max(95, min(xlim or [95])) and segments[:, :, 0].max() <= min(195, max(xlim or [195]))
+        assert segments[:, :, 1].min() >= max(467.5, min(ylim or [467.5])) and segments[:, :, 1].max() <= min(502.5, max(ylim or [502.5]))
+
+
+@pytest.mark.parametrize("rescale_mode", ["data", "axis"])
+@pytest.mark.parametrize("skip", [1, 2])
+def test_quiver_plots_only_arrows_within_limits(rescale_mode, skip):
+    x = 1000.0 * np.arange(20)
+    y = 1000.0 * np.arange(15)
+    ds = xr.Dataset(
+        {"u": (("y", "x"), np.ones((y.size, x.size))), "v": (("y", "x"), np.zeros((y.size, x.size)))}, coords={"x": x, "y": y}
+    ).rio.write_crs("EPSG:32631")
+    xlim, ylim = [4500.0, 12500.0], [3000.0, 9000.0]
+    _, ax = plt.subplots()
+    p = rpc.structured_data.quiver(
+        ds, ax=ax, x="x", y="y", u="u", v="v", xy_unit="km", rescale_mode=rescale_mode, skip=skip, smooth=5, xlim=xlim, ylim=ylim
+    )
+    plt.close("all")
+
+    # Check all arrows are within the limits (the smoothing halo is not plotted and skipping is aligned to the full data)
+    scale_factor = 1e-3 if rescale_mode == "data" else 1
+    n_x, n_y = (8, 7) if skip == 1 else (4, 3)
+    assert len(p.X) == n_x * n_y
+    assert p.X.min() >= xlim[0] * scale_factor and p.X.max() <= xlim[1] * scale_factor
+    assert p.Y.min() >= ylim[0] * scale_factor and p.Y.max() <= ylim[1] * scale_factor
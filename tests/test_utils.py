@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import xarray as xr
+import xugrid as xu
+
+import resilientplotterclass as rpc
+
+
+def _get_uda(name="mesh2d"):
+    # Get data on a grid of two triangles without edges
+    grid = xu.Ugrid2d(
+        node_x=np.array([0.0, 1.0, 1.0, 0.0]),
+        node_y=np.array([0.0, 0.0, 1.0, 1.0]),
+        fill_value=-1,
+        face_node_connectivity=np.array([[0, 1, 2], [0, 2, 3]]),
+        name=name,
+    )
+    return xu.UgridDataArray(xr.DataArray(np.array([1.0, 2.0]), dims=[grid.face_dimension]), grid=grid)
+
+
+@pytest.fixture
+def uda_without_edges(monkeypatch):
+    # Get data on a grid without edges and fail if the edges are derived
+    def get_uda(name):
+        uda = _get_uda(name=name)
+        uda.grid._edge_node_connectivity = None
+        uda.grid._face_edge_connectivity = None
+        monkeypatch.setattr(xu.Ugrid2d, "_edge_connectivity", lambda self: pytest.fail("Edges derived"))
+        return uda
+
+    return get_uda
+
+
+def test_rename_xugrid_reuses_standardised_data(uda_without_edges):
+    uda = uda_without_edges("mesh2d")
+    assert rpc.utils._rename_xugrid(uda) is uda
+
+
+def test_get_grid_dimensions(uda_without_edges):
+    uda = uda_without_edges("mesh")
+    assert rpc.utils._get_grid_dimensions(uda.grid) == {
+        "node_dimension": "mesh_nNodes",
+        "edge_dimension": "mesh_nEdges",
+        "face_dimension": "mesh_nFaces",
+    }
+
+
+def test_rename_xugrid_renames_dimensions():
+    uda = _get_uda(name="mesh")
+    uda_renamed = rpc.utils._rename_xugrid(uda)
+    assert uda_renamed.grid.name == "mesh2d"
+    assert uda_renamed.dims == ("mesh2d_nFaces",)
+    np.testing.assert_array_equal(uda_renamed.values, uda.values)
+
+
+@pytest.mark.parametrize("name", ["mesh2d", "mesh"])
+def test_reproject_xugrid_renames_dimensions(name):
+    uda = _get_uda(name=name).rename("data")
+    uda.grid.set_crs("EPSG:4326")
+    uda_reprojected = rpc.utils.reproject_xugrid(uda, "EPSG:3857")
+
+    # Check the data and grid dimensions match
+    assert uda_reprojected.dims == ("mesh2d_nFaces",)
+    assert uda_reprojected.grid.face_dimension == "mesh2d_nFaces"
+    assert len(uda_reprojected.ugrid.to_geodataframe()) == 2
+    np.testing.assert_array_equal(uda_reprojected.isel(mesh2d_nFaces=[1]).values, [2.0])